@@ -6,7 +6,9 @@ from qgis.core import (
     QgsFeatureRequest,
     QgsFields,
     QgsField,
+    QgsGeometry,
     QgsProcessingException,
+    QgsRectangle,
     QgsSpatialIndex,
     QgsVectorFileWriter,
     QgsVectorLayer,
@@ -22,6 +24,7 @@ def select_grid_cells(
     grid_layer: QgsVectorLayer,
     features_layer: QgsVectorLayer,
     output_path: str,
+    extent: QgsRectangle = None,
 ) -> QgsVectorLayer:
     """
     Select grid cells that intersect with features, count the number of intersecting features for each cell,
@@ -31,6 +34,8 @@ def select_grid_cells(
         grid_layer (QgsVectorLayer): The input grid layer containing polygon cells.
         features_layer (QgsVectorLayer): The input layer containing features (e.g., points, lines, polygons).
         output_path (str): The output path for the new grid layer with feature counts.
+        extent (QgsRectangle): Optional extent of the area being processed. When given, only the
+            grid cells intersecting it are indexed and features outside it are skipped.
 
     Returns:
         QgsVectorLayer: A new layer with grid cells containing a count of intersecting features.
@@ -41,14 +46,27 @@ def select_grid_cells(
         level=Qgis.Info,
     )
 
-    # Create a spatial index for the grid layer to optimize intersection queries
-    grid_index = QgsSpatialIndex(grid_layer.getFeatures())
+    # Create a spatial index for the grid layer to optimize intersection queries.
+    # The cell geometries are kept in the index so candidates can be checked
+    # without fetching each cell from the provider again.
+    grid_request = QgsFeatureRequest()
+    # Only the geometries of the features are needed for counting
+    feature_request = QgsFeatureRequest().setNoAttributes()
+    if extent is not None:
+        # Only the cells of the current area are rasterized, so there is no
+        # point indexing or testing anything beyond its extent.
+        grid_request.setFilterRect(extent)
+        feature_request.setFilterRect(extent)
+    grid_index = QgsSpatialIndex(
+        grid_layer.getFeatures(grid_request),
+        flags=QgsSpatialIndex.FlagStoreFeatureGeometries,
+    )
 
     # Create a dictionary to hold the count of intersecting features for each grid cell ID
     grid_feature_counts = {}
 
     # Iterate over each feature and use the spatial index to find the intersecting grid cells
-    for feature in features_layer.getFeatures():
+    for feature in features_layer.getFeatures(feature_request):
         feature_geom = feature.geometry()
 
         # Use bounding box only for point geometries; otherwise, use the actual geometry for intersection checks
@@ -68,10 +86,13 @@ def select_grid_cells(
                 tag="Geest",
                 level=Qgis.Info,
             )
+            # Prepare the feature geometry once for all the candidate cells
+            engine = QgsGeometry.createGeometryEngine(feature_geom.constGet())
+            engine.prepareGeometry()
             intersecting_ids = [
                 grid_id
                 for grid_id in intersecting_ids
-                if grid_layer.getFeature(grid_id).geometry().intersects(feature_geom)
+                if engine.intersects(grid_index.geometry(grid_id).constGet())
             ]
             log_message(
                 f"{len(intersecting_ids)} refined intersections found.",
@@ -114,30 +135,27 @@ def select_grid_cells(
         )
 
     # Select only grid cells based on the keys (grid IDs) in the grid_feature_counts dictionary
-    request = QgsFeatureRequest().setFilterFids(list(grid_feature_counts.keys()))
+    request = (
+        QgsFeatureRequest()
+        .setFilterFids(list(grid_feature_counts.keys()))
+        .setNoAttributes()
+    )
     log_message(
         f"Looping over {len(grid_feature_counts.keys())} grid polygons",
         tag="Geest",
         level=Qgis.Info,
     )
-    counter = 0
+    new_features = []
     for grid_feature in grid_layer.getFeatures(request):
-        log_message(f"Writing Feature #{counter}")
-        counter += 1
-        new_feature = QgsFeature()
+        grid_id = grid_feature.id()
+        new_feature = QgsFeature(fields)
         new_feature.setGeometry(grid_feature.geometry())  # Use the original geometry
+        # Set the 'id', 'intersecting_features' and (empty) 'value' attributes
+        new_feature.setAttributes([grid_id, grid_feature_counts[grid_id], None])
+        new_features.append(new_feature)
 
-        # Set the 'id' and 'intersecting_features' attributes
-        new_feature.setFields(fields)
-        new_feature.setAttribute("id", grid_feature.id())  # Set the grid cell ID
-        new_feature.setAttribute(
-            "intersecting_features", grid_feature_counts[grid_feature.id()]
-        )
-        new_feature.setAttribute("value", None)
-
-        # Write the feature to the new layer
-        writer.addFeature(new_feature)
-
+    # Write all the cells to the new layer in one call
+    writer.addFeatures(new_features)
     del writer  # Finalize the writer and close the file
 
     log_message(
@@ -8,6 +8,15 @@ from geest.utilities import resources_path
 from geest.core import setting
 from geest.utilities import log_message, is_qgis_dark_theme_active
 
+# Marker that workflows write into the result attribute when they succeed
+WORKFLOW_COMPLETED = "Workflow Completed"
+# Statuses returned by JsonTreeItem.getStatus that other code tests for
+STATUS_COMPLETED = "Completed successfully"
+STATUS_EXCLUDED = "Excluded from analysis"
+# Default font color, shared by all items. Items get a new QColor assigned
+# rather than modifying this one.
+_COLOR_BLACK = QColor(Qt.black)
+
 
 class JsonTreeItem:
     """A class representing a node in the tree.
@@ -20,47 +29,102 @@ class JsonTreeItem:
 
     """
 
+    # Items are created for every node in the tree, so avoid a per-instance
+    # __dict__. Class level resources (icons, fonts) are not slots.
+    __slots__ = (
+        "parentItem",
+        "itemData",
+        "childItems",
+        "_row",
+        "role",
+        "font_color",
+        "guid",
+        "_visible",
+        "_weight",
+        "_checked_result",
+        "_completed",
+    )
+
+    # Icon file used in the status column for each status
+    STATUS_ICON_FILES = {
+        STATUS_EXCLUDED: "excluded.svg",
+        STATUS_COMPLETED: "completed-success.svg",
+        "Required and not configured": "required-not-configured.svg",
+        "Not configured (optional)": "not-configured.svg",
+        "Configured, not run": "not-run.svg",
+        "Workflow failed": "failed.svg",
+    }
+    # Status icons shared by all items, loaded on first use
+    _status_icons = {}
+    # Role icons and fonts shared by all items, see _loadSharedResources
+    dimension_icon = None
+    factor_icon = None
+    indicator_icon = None
+    dimension_font = None
+    factor_font = None
+    default_font = None
+
     def __init__(self, data, role, guid=None, parent=None):
         self.parentItem = parent
         self.itemData = data  # name, status, weighting, attributes(dict)
         self.childItems = []
+        self._row = 0  # Position of this item in its parent's childItems
         self.role = role  # Stores whether an item is a dimension, factor, or layer
-        self.font_color = QColor(Qt.black)  # Default font color
+        self.font_color = _COLOR_BLACK  # Default font color
         # Add a unique guid for each item
         if guid:
             self.guid = guid
         else:
             self.guid = str(uuid.uuid4())  # Generate a unique identifier for this item
 
+        if JsonTreeItem.dimension_icon is None:
+            JsonTreeItem._loadSharedResources()
+
+        self._visible = True
+        # Weighting (column 2) stored as a float at full precision, or None
+        # when the column does not hold a number (e.g. the header). It is only
+        # rounded for display by the model.
+        self._weight = self._toWeight(data[2]) if len(data) > 2 else None
+        # The result string last checked by isCompleted and the outcome
+        self._checked_result = None
+        self._completed = False
+        self.isCompleted()
+
+    @classmethod
+    def _loadSharedResources(cls):
+        """Create the role icons and fonts once for all items.
+
+        Building these for every item made loading a large model slow.
+        """
         if is_qgis_dark_theme_active():
             # Define icons for each role
-            self.dimension_icon = QIcon(
+            cls.dimension_icon = QIcon(
                 resources_path("resources", "icons", "dimension-light.svg")
             )
-            self.factor_icon = QIcon(
+            cls.factor_icon = QIcon(
                 resources_path("resources", "icons", "factor-light.svg")
             )
-            self.indicator_icon = QIcon(
+            cls.indicator_icon = QIcon(
                 resources_path("resources", "icons", "indicator-light.svg")
             )
         else:
             # Define icons for each role
-            self.dimension_icon = QIcon(
+            cls.dimension_icon = QIcon(
                 resources_path("resources", "icons", "dimension.svg")
             )
-            self.factor_icon = QIcon(resources_path("resources", "icons", "factor.svg"))
-            self.indicator_icon = QIcon(
+            cls.factor_icon = QIcon(resources_path("resources", "icons", "factor.svg"))
+            cls.indicator_icon = QIcon(
                 resources_path("resources", "icons", "indicator.svg")
             )
 
         # Define fonts for each role
-        self.dimension_font = QFont()
-        self.dimension_font.setBold(True)
+        cls.dimension_font = QFont()
+        cls.dimension_font.setBold(True)
 
-        self.factor_font = QFont()
-        self.factor_font.setItalic(True)
+        cls.factor_font = QFont()
+        cls.factor_font.setItalic(True)
 
-        self._visible = True
+        cls.default_font = QFont()
 
     def set_visibility(self, visible: bool):
         """Sets the visibility of this item."""
@@ -81,8 +145,19 @@ class JsonTreeItem:
         return self.guid
 
     def appendChild(self, item):
+        item._row = len(self.childItems)
         self.childItems.append(item)
 
+    def removeChildren(self, row, count=1):
+        """Remove count children starting at row.
+
+        The stored row of the children after the removed ones is updated
+        so that row() stays correct.
+        """
+        del self.childItems[row : row + count]
+        for index in range(row, len(self.childItems)):
+            self.childItems[index]._row = index
+
     def child(self, row):
         return self.childItems[row]
 
@@ -99,16 +174,20 @@ class JsonTreeItem:
         """
         if not recursive:
             return len(self.childItems)
-        else:
-            count = len(self.childItems)
-            for child in self.childItems:
-                count += child.childCount(recursive=True)
-            return count
+        count = 0
+        stack = list(self.childItems)
+        while stack:
+            child = stack.pop()
+            count += 1
+            stack.extend(child.childItems)
+        return count
 
     def columnCount(self):
         return len(self.itemData)
 
     def data(self, column):
+        if column == 2 and self._weight is not None:
+            return self._weight
         if column < len(self.itemData):
             return self.itemData[column]
         return None
@@ -116,15 +195,28 @@ class JsonTreeItem:
     def setData(self, column, value):
         if column < len(self.itemData):
             self.itemData[column] = value
+            if column == 2:
+                self._weight = self._toWeight(value)
             return True
         return False
 
+    @staticmethod
+    def _toWeight(value):
+        """Convert a weighting to a float.
+
+        Returns None if the value is not a number.
+        """
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
     def parent(self):
         return self.parentItem
 
     def row(self):
         if self.parentItem:
-            return self.parentItem.childItems.index(self)
+            return self._row
         return 0
 
     def name(self):
@@ -181,26 +273,19 @@ class JsonTreeItem:
             data["analysis_weighting"] = data.get("default_analysis_weighting", 1.0)
         if self.isFactor():
             data["dimension_weighting"] = data.get("default_dimension_weighting", 1.0)
-            if (
-                self.parentItem
-                and self.parentItem.getStatus() == "Excluded from analysis"
-            ):
+            if self.parentItem and self.parentItem.getStatus() == STATUS_EXCLUDED:
                 self.parentItem.attributes()["analysis_weighting"] = (
                     self.parentItem.attribute("default_analysis_weighting")
                 )
         if self.isIndicator():
             data["factor_weighting"] = data.get("default_factor_weighting", 1.0)
-            if (
-                self.parentItem
-                and self.parentItem.getStatus() == "Excluded from analysis"
-            ):
+            if self.parentItem and self.parentItem.getStatus() == STATUS_EXCLUDED:
                 self.parentItem.attributes()["dimension_weighting"] = (
                     self.parentItem.attribute("default_dimension_weighting")
                 )
                 if (
                     self.parentItem.parentItem
-                    and self.parentItem.parentItem.getStatus()
-                    == "Excluded from analysis"
+                    and self.parentItem.parentItem.getStatus() == STATUS_EXCLUDED
                 ):
                     self.parentItem.parentItem.attributes()["analysis_weighting"] = (
                         self.parentItem.parentItem.attribute(
@@ -245,27 +330,18 @@ class JsonTreeItem:
         return ""
 
     def getStatusIcon(self):
-        """Retrieve the appropriate icon for the item based on its role."""
-        status = self.getStatus()
+        """Retrieve the appropriate icon for the item based on its status.
 
-        if status == "Excluded from analysis":
-            return QIcon(resources_path("resources", "icons", "excluded.svg"))
-        if status == "Completed successfully":
-            return QIcon(resources_path("resources", "icons", "completed-success.svg"))
-        elif status == "Required and not configured":
-            return QIcon(
-                resources_path("resources", "icons", "required-not-configured.svg")
-            )
-        elif status == "Not configured (optional)":
-            return QIcon(resources_path("resources", "icons", "not-configured.svg"))
-        elif status == "Configured, not run":
-            return QIcon(resources_path("resources", "icons", "not-run.svg"))
-        elif status == "Workflow failed":
-            return QIcon(resources_path("resources", "icons", "failed.svg"))
-        elif status == "WRITE TOOL TIP":
-            return QIcon(resources_path("resources", "icons", ".svg"))
-        else:
-            return QIcon(resources_path("resources", "icons", ".svg"))
+        Icons are shared between all items and only loaded the first time
+        a status is seen.
+        """
+        status = self.getStatus()
+        icon = JsonTreeItem._status_icons.get(status)
+        if icon is None:
+            icon_file = JsonTreeItem.STATUS_ICON_FILES.get(status, ".svg")
+            icon = QIcon(resources_path("resources", "icons", icon_file))
+            JsonTreeItem._status_icons[status] = icon
+        return icon
 
     def getStatus(self):
         """Return the status of the item as single character."""
@@ -277,13 +353,14 @@ class JsonTreeItem:
 
             data = self.attributes()
             analysis_mode = data.get("analysis_mode", "")
-            qgis_layer_source_key = analysis_mode.replace("use_", "") + "_layer_source"
-            qgis_layer_shapefile_key = analysis_mode.replace("use_", "") + "_shapefile"
-            qgis_layer_raster_key = analysis_mode.replace("use_", "") + "_raster"
+            key_prefix = analysis_mode.replace("use_", "")
+            qgis_layer_source_key = key_prefix + "_layer_source"
+            qgis_layer_shapefile_key = key_prefix + "_shapefile"
+            qgis_layer_raster_key = key_prefix + "_raster"
             status = ""
 
-            if "Workflow Completed" in data.get("result", ""):
-                return "Completed successfully"
+            if self.isCompleted():
+                return STATUS_COMPLETED
 
             # First check if the item weighting is 0, or its parent factor is zero
             # If so, return "Excluded from analysis"
@@ -295,14 +372,14 @@ class JsonTreeItem:
                 )
                 required_by_self = float(data.get("factor_weighting", 0.0))
                 if not required_by_parent or not required_by_self:
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
 
                 # Avoid infinite recursion by NOT using getStatus in the parent checks
                 # If the parent's dimension weighting is zero, return "Excluded from analysis"
                 if self.parentItem and not float(
                     self.parentItem.attribute("dimension_weighting", 0.0)
                 ):
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
                 # If the grandparent's analysis weighting is zero, return "Excluded from analysis"
                 if (
                     self.parentItem
@@ -311,12 +388,12 @@ class JsonTreeItem:
                         self.parentItem.parentItem.attribute("analysis_weighting", 0.0)
                     )
                 ):
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
 
             if self.isFactor():
                 # If the dimension weighting is zero, return "Excluded from analysis"
                 if not float(data.get("dimension_weighting", 0.0)):
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
 
                 # If the sum of the indicator weightings is zero, return "Excluded from analysis"
                 weight_sum = 0
@@ -329,7 +406,7 @@ class JsonTreeItem:
                     ]:
                         unconfigured_child_count += 1
                 if not weight_sum:
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
                 if unconfigured_child_count:
                     return "Required and not configured"
 
@@ -337,12 +414,12 @@ class JsonTreeItem:
                 if self.parentItem and not float(
                     self.parentItem.attribute("analysis_weighting", 0.0)
                 ):
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
 
             if self.isDimension():
                 # If the analysis weighting is zero, return "Excluded from analysis"
                 if not float(data.get("analysis_weighting", 0.0)):
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
 
                 # If the sum of the factor weightings is zero, return "Excluded from analysis"
                 weight_sum = sum(
@@ -350,7 +427,7 @@ class JsonTreeItem:
                     for child in self.childItems
                 )
                 if not weight_sum:
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
 
             if self.isAnalysis():
                 # If the sum of the dimension weightings is zero, return "Excluded from analysis"
@@ -359,7 +436,7 @@ class JsonTreeItem:
                     for child in self.childItems
                 )
                 if not weight_sum:
-                    return "Excluded from analysis"
+                    return STATUS_EXCLUDED
 
             # Check for workflow errors
             if "Error" in data.get("result", "") or "Failed" in data.get("result", ""):
@@ -416,13 +493,26 @@ class JsonTreeItem:
                 log_message(traceback.format_exc(), level=Qgis.Warning)
             return f"Status Failed - {e}"
 
+    def isCompleted(self) -> bool:
+        """Return True if the result attribute says the workflow completed.
+
+        Workflows replace the result string when they finish, so the string
+        is only searched again when it is a different object from the one
+        checked last time.
+        """
+        result = self.attributes().get("result", "")
+        if result is not self._checked_result:
+            self._checked_result = result
+            self._completed = isinstance(result, str) and WORKFLOW_COMPLETED in result
+        return self._completed
+
     def getFont(self):
         """Retrieve the appropriate font for the item based on its role."""
         if self.isDimension():
             return self.dimension_font
         elif self.isFactor():
             return self.factor_font
-        return QFont()
+        return self.default_font
 
     def getPaths(self) -> []:
         """Return the path of the item in the tree in the form dimension/factor/indicator.
@@ -535,63 +625,74 @@ class JsonTreeItem:
                             self.setAnalysisMode(key)
                             break
 
+    def _getDescendants(self, role, include_completed, include_disabled):
+        """Return the items with the given role at or under this item.
+
+        :param role: The role of the items to return.
+        :param include_completed: If True, also return items that are completed.
+        :param include_disabled: If True, also return items that are disabled.
+        """
+        return self.getDescendantsByRole(
+            (role,),
+            include_completed=include_completed,
+            include_disabled=include_disabled,
+        )[role]
+
+    def getDescendantsByRole(
+        self, roles, include_completed=True, include_disabled=False
+    ):
+        """Return the items at or under this item grouped by their role.
+
+        Walks the tree once with an explicit stack (in the same depth first
+        order as the tree view) and sorts the items into a list per role.
+
+        :param roles: The roles of the items to return.
+        :param include_completed: If True, also return items that are completed.
+        :param include_disabled: If True, also return items that are disabled.
+        :return: Dict mapping each role to the list of items with that role.
+        """
+        items = {role: [] for role in roles}
+        stack = [self]
+        while stack:
+            item = stack.pop()
+            if item.role in items:
+                status = item.getStatus()
+                if status != STATUS_COMPLETED or include_completed:
+                    if status != STATUS_EXCLUDED or include_disabled:
+                        items[item.role].append(item)
+            stack.extend(reversed(item.childItems))
+        return items
+
     def getDescendantIndicators(self, include_completed=True, include_disabled=False):
         """Return the list of indicators under this item.
 
-        Recurses through the tree to find all indicators under this item.
+        Walks the tree to find all indicators under this item.
 
-        :param include_completed: If True, only return indicators that are completed.
+        :param include_completed: If True, also return indicators that are completed.
         :param include_disabled: If True, also return indicators that are disabled.
 
         """
-        indicators = []
-        if self.isIndicator():
-            if self.getStatus() != "Completed successfully" or include_completed:
-                if self.getStatus() != "Excluded from analysis" or include_disabled:
-                    indicators.append(self)
-        for child in self.childItems:
-            indicators.extend(child.getDescendantIndicators())
-        return indicators
+        return self._getDescendants("indicator", include_completed, include_disabled)
 
     def getDescendantFactors(self, include_completed=True, include_disabled=False):
         """Return the list of factors under this item.
 
-        Recurses through the tree to find all factors under this item.
+        Walks the tree to find all factors under this item.
 
         :param include_completed: If True, also return factors that are completed.
         :param include_disabled: If True, also return factors that are disabled.
         """
-        factors = []
-        if self.isFactor():
-            if self.getStatus() != "Completed successfully" or include_completed:
-                if self.getStatus() != "Excluded from analysis" or include_disabled:
-                    factors.append(self)
-        for child in self.childItems:
-            factors.extend(
-                child.getDescendantFactors(include_completed, include_disabled)
-            )
-        return factors
+        return self._getDescendants("factor", include_completed, include_disabled)
 
     def getDescendantDimensions(self, include_completed=True, include_disabled=False):
         """Return the list of dimensions under this item.
 
-        Recurses through the tree to find all dimensions under this item.
+        Walks the tree to find all dimensions under this item.
 
         :param include_completed: If True, include dimensions that are completed.
         :param include_disabled: If True, include dimensions that are disabled.
-        result_file
         """
-
-        dimensions = []
-        if self.isDimension():
-            if self.getStatus() != "Completed successfully" or include_completed:
-                if self.getStatus() != "Excluded from analysis" or include_disabled:
-                    dimensions.append(self)
-        for child in self.childItems:
-            dimensions.extend(
-                child.getDescendantDimensions(include_completed, include_disabled)
-            )
-        return dimensions
+        return self._getDescendants("dimension", include_completed, include_disabled)
 
     def getFactorIndicatorGuids(self):
         """Return the list of indicators under this factor."""
@@ -637,7 +738,7 @@ class JsonTreeItem:
                 log_message(
                     f"Updating weighting for {indicator_guid} to {new_weighting}"
                 )
-                indicator_item.setData(2, f"{new_weighting:.2f}")
+                indicator_item.setData(2, new_weighting)
                 # weighting references the level above (i.e. factor)
                 indicator_item.attributes()["factor_weighting"] = new_weighting
             else:
@@ -659,7 +760,7 @@ class JsonTreeItem:
             factor_item = self.getItemByGuid(factor_guid)
             # If found, update the weighting
             if factor_item:
-                factor_item.setData(2, f"{new_weighting:.2f}")
+                factor_item.setData(2, new_weighting)
                 # weighting references the level above (i.e. dimension)
                 factor_item.attributes()["dimension_weighting"] = new_weighting
 
@@ -682,7 +783,7 @@ class JsonTreeItem:
             dimension_item = self.getItemByGuid(dimension_guid)
             # If found, update the weighting
             if dimension_item:
-                dimension_item.setData(2, f"{new_weighting:.2f}")
+                dimension_item.setData(2, new_weighting)
                 # weighting references the level above (i.e. analysis)
                 dimension_item.attributes()["analysis_weighting"] = new_weighting
 
@@ -1,4 +1,5 @@
 import os
+import time
 from qgis.PyQt.QtCore import QUrl, QByteArray, QObject, pyqtSignal
 from qgis.PyQt.QtNetwork import QNetworkRequest
 from qgis.core import (
@@ -10,6 +11,11 @@ import json
 from geest.core import setting
 from geest.utilities import log_message
 
+# How often a rate limited (HTTP 429) request is retried before giving up
+RATE_LIMIT_RETRIES = 3
+# Seconds to wait before the first retry, doubled for each further retry
+RATE_LIMIT_BACKOFF_SECONDS = 2
+
 
 class ORSClient(QObject):
     # Signal to emit when the request is finished
@@ -35,7 +41,8 @@ class ORSClient(QObject):
         """Make a request to the ORS API.
 
         This will make a blocking post request to the ORS API and return the response as a JSON object.
-        It is intended to be used in a thread so that the UI does not freeze.
+        It is intended to be used in a thread so that the UI does not freeze. Rate limited
+        requests (HTTP 429) are retried a few times with an increasing delay.
 
         Args:
             endpoint (str): The endpoint to send the request to.
@@ -61,11 +68,21 @@ class ORSClient(QObject):
         if verbose_mode:
             log_message(f"Request parameters: {params}")
 
-        # Send the request and connect the finished signal
-        reply = self.network_manager.blockingPost(request, data)
+        # Send the request, backing off and retrying when ORS rate limits us
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            reply = self.network_manager.blockingPost(request, data)
+            status_code = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
+            if status_code != 429 or attempt == RATE_LIMIT_RETRIES:
+                break
+            delay = RATE_LIMIT_BACKOFF_SECONDS * 2**attempt
+            log_message(
+                f"ORS rate limit reached, retrying in {delay} seconds",
+                tag="Geest",
+                level=Qgis.Warning,
+            )
+            time.sleep(delay)
 
         # Check HTTP status code
-        status_code = reply.attribute(QNetworkRequest.HttpStatusCodeAttribute)
         if status_code is None:
             raise RuntimeError("No status code received. Network issue?")
 
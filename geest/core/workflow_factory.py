@@ -33,6 +33,26 @@ class WorkflowFactory:
     The workflows accept a QgsFeedback object to report progress and handle cancellation.
     """
 
+    # Workflow class for each analysis mode
+    WORKFLOW_CLASSES = {
+        "use_index_score": DefaultIndexScoreWorkflow,
+        "Do Not Use": DontUseWorkflow,
+        "use_multi_buffer_point": MultiBufferDistancesWorkflow,
+        "use_single_buffer_point": SinglePointBufferWorkflow,
+        "use_point_per_cell": PointPerCellWorkflow,
+        "use_polyline_per_cell": PolylinePerCellWorkflow,
+        "use_polygon_per_cell": PolygonPerCellWorkflow,
+        "factor_aggregation": FactorAggregationWorkflow,
+        "dimension_aggregation": DimensionAggregationWorkflow,
+        "analysis_aggregation": AnalysisAggregationWorkflow,
+        "use_csv_to_point_layer": AcledImpactWorkflow,
+        "use_classify_polygon_into_classes": ClassifiedPolygonWorkflow,
+        "use_classify_safety_polygon_into_classes": SafetyPolygonWorkflow,
+        "use_nighttime_lights": SafetyRasterWorkflow,
+        "use_environmental_hazards": RasterReclassificationWorkflow,
+        "use_street_lights": StreetLightsBufferWorkflow,
+    }
+
     def create_workflow(
         self,
         item: JsonTreeItem,
@@ -63,47 +83,10 @@ class WorkflowFactory:
             log_message(f"-----------------------")
 
             analysis_mode = attributes.get("analysis_mode", "")
-
-            if analysis_mode == "use_index_score":
-                return DefaultIndexScoreWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "Do Not Use":
-                return DontUseWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_multi_buffer_point":
-                return MultiBufferDistancesWorkflow(
-                    item, cell_size_m, feedback, context
-                )
-            elif analysis_mode == "use_single_buffer_point":
-                return SinglePointBufferWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_point_per_cell":
-                return PointPerCellWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_polyline_per_cell":
-                return PolylinePerCellWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_polygon_per_cell":
-                return PolygonPerCellWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "factor_aggregation":
-                return FactorAggregationWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "dimension_aggregation":
-                return DimensionAggregationWorkflow(
-                    item, cell_size_m, feedback, context
-                )
-            elif analysis_mode == "analysis_aggregation":
-                return AnalysisAggregationWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_csv_to_point_layer":
-                return AcledImpactWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_classify_polygon_into_classes":
-                return ClassifiedPolygonWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_classify_safety_polygon_into_classes":
-                return SafetyPolygonWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_nighttime_lights":
-                return SafetyRasterWorkflow(item, cell_size_m, feedback, context)
-            elif analysis_mode == "use_environmental_hazards":
-                return RasterReclassificationWorkflow(
-                    item, cell_size_m, feedback, context
-                )
-            elif analysis_mode == "use_street_lights":
-                return StreetLightsBufferWorkflow(item, cell_size_m, feedback, context)
-            else:
+            workflow_class = self.WORKFLOW_CLASSES.get(analysis_mode)
+            if workflow_class is None:
                 raise ValueError(f"Unknown Analysis Mode: {analysis_mode}")
+            return workflow_class(item, cell_size_m, feedback, context)
 
         except Exception as e:
             log_message(f"Error creating workflow: {e}", level=Qgis.Critical)
@@ -131,3 +131,10 @@ class WorkflowQueue(QObject):
         """
         self.job_queue.append(job)
         self.total_queue_size += 1
+
+    def add_jobs(self, jobs: List[WorkflowJob]):
+        """
+        Adds several jobs to the queue in one go
+        """
+        self.job_queue.extend(jobs)
+        self.total_queue_size += len(jobs)
@@ -1,3 +1,4 @@
+from typing import List
 from PyQt5.QtCore import QObject, pyqtSignal
 from qgis.core import Qgis, QgsTask, QgsProcessingContext, QgsProject
 from .workflow_queue import WorkflowQueue
@@ -46,13 +47,13 @@ class WorkflowQueueManager(QObject):
         log_message(f"Task added")
         return task
 
-    def add_workflow(self, item: JsonTreeItem, cell_size_m: float) -> None:
+    def _create_job(self, item: JsonTreeItem, cell_size_m: float) -> WorkflowJob:
         """
-        Add a task to the WorkflowQueue for QgsProcessingContext using the item provided.
-
-        Internally uses the WorkflowFactory to create the appropriate workflow.
+        Create the WorkflowJob for an item, without queueing it.
 
         :param item: A reference to a JsonTreeItem object representing the task
+        :param cell_size_m: Cell size in meters for raster operations
+        :return: The WorkflowJob task
         """
         # Create a new QgsProcessingContext so we can pass the QgsProject instance
         # to the threads in a thread safe manner
@@ -61,16 +62,42 @@ class WorkflowQueueManager(QObject):
 
         # ⭐️ Note we are passing the item reference to the WorkflowJob
         #    any changes made to the item will be reflected in the tree directly
-        task = WorkflowJob(
+        return WorkflowJob(
             description="Geest Task",
             item=item,
             cell_size_m=cell_size_m,
             context=context,
         )
+
+    def add_workflow(self, item: JsonTreeItem, cell_size_m: float) -> None:
+        """
+        Add a task to the WorkflowQueue for QgsProcessingContext using the item provided.
+
+        Internally uses the WorkflowFactory to create the appropriate workflow.
+
+        :param item: A reference to a JsonTreeItem object representing the task
+        """
+        task = self._create_job(item, cell_size_m)
         self.workflow_queue.add_job(task)
         log_message(f"Task added: {task.description()}")
         return task
 
+    def add_workflows(self, items: List[JsonTreeItem], cell_size_m: float) -> list:
+        """
+        Add a batch of tasks to the WorkflowQueue, one for each item provided.
+
+        Equivalent to calling add_workflow for every item, but the jobs are
+        handed to the queue in a single call.
+
+        :param items: A list of references to JsonTreeItem objects
+        :param cell_size_m: Cell size in meters for raster operations
+        :return: The list of WorkflowJob tasks created, in the order of items
+        """
+        tasks = [self._create_job(item, cell_size_m) for item in items]
+        self.workflow_queue.add_jobs(tasks)
+        log_message(f"{len(tasks)} tasks added")
+        return tasks
+
     def start_processing(self) -> None:
         """Start processing the tasks in the WorkflowQueue."""
         log_message("Starting workflow queue processing...")
@@ -1,5 +1,8 @@
+import hashlib
+import json
 import os
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from qgis.core import (
     edit,
     Qgis,
@@ -22,6 +25,9 @@ from .workflow_base import WorkflowBase
 from geest.core import JsonTreeItem, setting
 from geest.utilities import log_message
 
+# Segments per quarter circle for straight line buffers
+BUFFER_SEGMENTS = 32
+
 
 class MultiBufferDistancesWorkflow(WorkflowBase):
     """
@@ -60,7 +66,12 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
             item, cell_size_m, feedback, context, working_directory
         )  # ⭐️ Item is a reference - whatever you change in this item will directly update the tree
         self.workflow_name = "use_multi_buffer_point"
-        self.distances = self.attributes.get("multi_buffer_travel_distances", None)
+        # Prefer the distances already parsed by the configuration widget
+        self.distances = self.attributes.get(
+            "multi_buffer_travel_distances_parsed", None
+        )
+        if not self.distances:
+            self.distances = self.attributes.get("multi_buffer_travel_distances", None)
         if not self.distances:
             log_message(
                 "Invalid travel distances, using default.",
@@ -76,7 +87,11 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
                 )
                 raise Exception("Invalid travel distances.")
         try:
-            self.distances = [float(x.strip()) for x in self.distances.split(",")]
+            if isinstance(self.distances, str):
+                self.distances = self.distances.split(",")
+            # Sorted like the widget's parsed list so the nearest band always
+            # gets the highest score, whichever order the user typed
+            self.distances = sorted(float(x) for x in self.distances)
         except Exception as e:
             log_message(
                 "Invalid travel distances provided. Distances should be a comma-separated list of up to 5 numbers.",
@@ -126,15 +141,39 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
         # How many features to pass with each ORS API call
         # Managed in the settings panel
         self.subset_size = int(setting(key="ors_request_size", default=5))
+        # How many ORS API calls may be in flight at the same time. Managed in
+        # the settings panel, one by default to stay within free key rate limits
+        self.parallel_requests = max(
+            1, int(setting(key="ors_parallel_requests", default=1))
+        )
 
-        self.ors_client = ORSClient("https://api.openrouteservice.org/v2/isochrones")
-        self.api_key = self.ors_client.check_api_key()
-        # Create the masked API key for logging
-        self.masked_api_key = (
-            self.api_key[:4] + "*" * (len(self.api_key) - 8) + self.api_key[-4:]
+        # Optionally use straight line buffers instead of network distances
+        # when measuring by distance. This needs no ORS calls but ignores the
+        # road network, so it is off unless enabled in the settings.
+        self.euclidean_buffers = self.measurement == "distance" and bool(
+            int(setting(key="multi_buffer_euclidean_distance", default=0))
         )
+
         self.temp_layers = []  # Store intermediate layers
-        log_message(f"Using ORS API key: {self.masked_api_key}")
+        if self.euclidean_buffers:
+            self.masked_api_key = ""
+            log_message("Using straight line buffers, ORS will not be called")
+        else:
+            self.ors_client = ORSClient(
+                "https://api.openrouteservice.org/v2/isochrones"
+            )
+            self.api_key = self.ors_client.check_api_key()
+            # Create the masked API key for logging
+            self.masked_api_key = (
+                self.api_key[:4] + "*" * (len(self.api_key) - 8) + self.api_key[-4:]
+            )
+            log_message(f"Using ORS API key: {self.masked_api_key}")
+            # ORS responses are cached in the working directory so repeated runs,
+            # and other indicators using the same points, skip the network call
+            self.isochrone_cache_directory = os.path.join(
+                self.working_directory, "isochrone_cache"
+            )
+            os.makedirs(self.isochrone_cache_directory, exist_ok=True)
         log_message("Multi Buffer Distances Workflow initialized")
 
     def _process_features_for_area(
@@ -184,34 +223,86 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
 
         This method processes the point features in subsets (to handle large datasets), makes API calls
         to the OpenRouteService to fetch the isochrones (buffers) for each subset, and merges the results
-        into a final output layer.
+        into a final output layer. The API calls for several subsets are made concurrently since each
+        one spends most of its time waiting on the network.
 
         :param point_layer: QgsVectorLayer containing point features to process.
         :param index: Index of the current area being processed.
         :return: QgsVectorLayer containing the buffers as polygons.
         """
+        if self.euclidean_buffers:
+            features = list(point_layer.getFeatures())
+            log_message(f"Creating straight line buffers for {len(features)} points")
+            self.temp_layers.append(
+                self._create_distance_buffers(features, point_layer)
+            )
+            return self._merge_and_band(index)
+
         log_message(f"Using ORS API key: {self.masked_api_key}")
 
         # Collect intermediate layers from ORS API
-        features = list(point_layer.getFeatures())
+        features = self._sort_features_spatially(
+            list(point_layer.getFeatures()), point_layer.extent()
+        )
         log_message(f"Creating buffers for {len(features)} points")
         total_features = len(features)
 
         # Process features in subsets to handle large datasets
-        for i in range(0, total_features, self.subset_size):
-            subset_features = features[i : i + self.subset_size]
-            subset_layer = self._create_subset_layer(subset_features, point_layer)
-
-            # Make API calls using ORSClient for the subset
-            json = self._fetch_isochrones(subset_layer)
-            layer = self._create_isochrone_layer(json)
-            self.temp_layers.append(layer)
-            log_message(
-                f"Processed subset {i + 1} to {min(i + self.subset_size, total_features)} of {total_features}",
-                tag="Geest",
-                level=Qgis.Info,
+        starts = range(0, total_features, self.subset_size)
+        subset_coordinates = [
+            self._get_coordinates(
+                self._create_subset_layer(
+                    features[i : i + self.subset_size], point_layer
+                )
             )
+            for i in starts
+        ]
+
+        # Make API calls using ORSClient for the subsets, several at a time.
+        # Only the requests run in the pool, the layers are built here as the
+        # responses come back in subset order.
+        executor = ThreadPoolExecutor(max_workers=self.parallel_requests)
+        futures = [
+            executor.submit(self._fetch_isochrones, coordinates)
+            for coordinates in subset_coordinates
+        ]
+        try:
+            for i, future in zip(starts, futures):
+                if self.feedback.isCanceled():
+                    return False
+                try:
+                    response = future.result()
+                except Exception as e:
+                    # Reported here, on the task thread, rather than in the
+                    # worker so error.txt and the item attributes are only
+                    # ever written from one thread
+                    self._report_fetch_error(e)
+                    response = False
+                if self.feedback.isCanceled():
+                    return False
+                layer = self._create_isochrone_layer(response)
+                self.temp_layers.append(layer)
+                log_message(
+                    f"Processed subset {i + 1} to {min(i + self.subset_size, total_features)} of {total_features}",
+                    tag="Geest",
+                    level=Qgis.Info,
+                )
+        finally:
+            # On cancel (or error) drop the requests that have not started yet
+            # and return without waiting for the ones already in flight
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+        return self._merge_and_band(index)
 
+    def _merge_and_band(self, index: int):
+        """
+        Merge the collected buffer layers and turn them into non overlapping bands.
+
+        :param index: Index of the current area being processed.
+        :return: QgsVectorLayer containing the bands, or False if there were no buffers.
+        """
         # Merge all isochrone layers into one final output
         if self.temp_layers:
             log_message(
@@ -236,6 +327,81 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
             log_message("No isochrones were created.", level=Qgis.Warning)
             return False
 
+    def _create_distance_buffers(
+        self, features: list, point_layer: QgsVectorLayer
+    ) -> QgsVectorLayer:
+        """
+        Create straight line buffers around each point for every travel distance.
+
+        The output has the same 'value' field as the ORS isochrone layers so
+        it can be merged and banded in the same way.
+
+        :param features: List of QgsFeature point features.
+        :param point_layer: The layer the features came from, used for its CRS.
+        :return: A memory QgsVectorLayer of buffer polygons in the target CRS.
+        """
+        buffer_layer = QgsVectorLayer(
+            f"Polygon?crs={self.target_crs.authid()}", "buffers", "memory"
+        )
+        provider = buffer_layer.dataProvider()
+        provider.addAttributes([QgsField("value", QVariant.Int)])
+        buffer_layer.updateFields()
+
+        # Buffer in the (projected) target CRS so distances are in meters
+        transform = QgsCoordinateTransform(
+            point_layer.crs(),
+            self.target_crs,
+            self.context.project().transformContext(),
+        )
+        buffers = []
+        for feature in features:
+            geom = QgsGeometry(feature.geometry())
+            if geom.isEmpty():
+                continue
+            geom.transform(transform)
+            for distance in self.distances:
+                buffer = QgsFeature(buffer_layer.fields())
+                buffer.setGeometry(geom.buffer(distance, BUFFER_SEGMENTS))
+                buffer.setAttributes([distance])
+                buffers.append(buffer)
+        provider.addFeatures(buffers)
+        return buffer_layer
+
+    def _sort_features_spatially(self, features: list, extent) -> list:
+        """
+        Sort point features along a Z-order (Morton) curve over the layer extent.
+
+        Consecutive features in the result are close to each other, so each
+        subset sent to ORS covers a compact area rather than points scattered
+        across the whole study area.
+
+        :param features: List of QgsFeature point features.
+        :param extent: QgsRectangle covering the features.
+        :return: The features in Z-order. Features without a geometry go last.
+        """
+        width = extent.width() or 1.0
+        height = extent.height() or 1.0
+        x_min = extent.xMinimum()
+        y_min = extent.yMinimum()
+        scale = 0xFFFF  # Quantize each axis to 16 bits
+
+        def morton_key(feature):
+            geom = feature.geometry()
+            if geom is None or geom.isEmpty():
+                return 1 << 32
+            point = geom.centroid().asPoint()
+            x = int((point.x() - x_min) / width * scale)
+            y = int((point.y() - y_min) / height * scale)
+            x = min(max(x, 0), scale)
+            y = min(max(y, 0), scale)
+            key = 0
+            for bit in range(16):
+                key |= ((x >> bit) & 1) << (2 * bit)
+                key |= ((y >> bit) & 1) << (2 * bit + 1)
+            return key
+
+        return sorted(features, key=morton_key)
+
     def _create_subset_layer(self, subset_features, point_layer):
         """
         Create a subset layer for processing, with reprojection of points
@@ -279,21 +445,19 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
 
         return subset_layer
 
-    def _fetch_isochrones(self, layer: QgsVectorLayer) -> dict:
+    def _get_coordinates(self, layer: QgsVectorLayer) -> list:
         """
-        Fetch isochrones for the given subset of features using ORSClient.
+        Get the coordinates of the point features in a subset layer.
 
         Args:
             layer (QgsVectorLayer): A QgsVectorLayer containing the subset of features.
 
         Returns:
-            dict: A dict representing the JSON response from the ORS API.
+            list: A list of [x, y] coordinates for the ORS API request.
 
         Raises:
             ValueError: If no valid coordinates are found in the layer.
-            Any exceptions raised by ORSClient.make_request will propagate.
         """
-        # Prepare the coordinates for the API request
         coordinates = []
         for feature in layer.getFeatures():
             geom = feature.geometry()
@@ -303,6 +467,27 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
 
         if not coordinates:
             raise ValueError("No valid coordinates found in the layer")
+        return coordinates
+
+    def _fetch_isochrones(self, coordinates: list) -> dict:
+        """
+        Fetch isochrones for the given subset of points using ORSClient.
+
+        This only makes the network request (or reads the cache) so it can be run
+        from a worker thread, away from the layer the coordinates were read from.
+        Errors are not handled here, create_multibuffers reports them.
+
+        Args:
+            coordinates (list): The [x, y] coordinates of the points, in EPSG:4326.
+
+        Returns:
+            dict: A dict representing the JSON response from the ORS API.
+
+        Raises:
+            Any exceptions raised by ORSClient.make_request will propagate.
+        """
+        if self.feedback.isCanceled():
+            return False
 
         # Prepare parameters for ORS API
         params = {
@@ -311,38 +496,77 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
             "range_type": self.measurement,
         }
 
+        cache_path = self._isochrone_cache_path(coordinates)
+        if os.path.exists(cache_path):
+            with open(cache_path, "r") as f:
+                return json.load(f)
+
         # Make the request to ORS API using ORSClient
-        # Any exceptions will be propogated
-        try:
-            json = self.ors_client.make_request(self.mode, params)
-        except Exception as e:
-            error_file = os.path.join(self.workflow_directory, "error.txt")
-            if os.path.exists(error_file):
-                os.remove(error_file)
-            # Write the traceback to error.txt in the workflow_directory
-            error_path = os.path.join(self.workflow_directory, "error.txt")
-            with open(error_path, "w") as f:
-                f.write(f"Failed to process {self.workflow_name}: {e}\n")
-                f.write(traceback.format_exc())
+        # Any exceptions will be propogated to the caller
+        response = self.ors_client.make_request(self.mode, params)
+        if response:
+            # Write to a temporary name first so a partly written file is never
+            # read back, even if two workers fetch the same points at once
+            temporary_path = f"{cache_path}.{os.getpid()}.{id(response)}"
+            with open(temporary_path, "w") as f:
+                json.dump(response, f)
+            os.replace(temporary_path, cache_path)
+        return response
+
+    def _report_fetch_error(self, e: Exception):
+        """
+        Record a failed isochrone request in error.txt and the item attributes.
 
-            log_message(
-                f"Failed to fetch isochrones layer for {self.workflow_name}: {e}",
-                tag="Geest",
-                level=Qgis.Critical,
-            )
-            log_message(
-                traceback.format_exc(),
-                tag="Geest",
-                level=Qgis.Critical,
-            )
-            self.attributes[self.result_key] = f"{self.workflow_name} Workflow Error"
-            self.attributes[self.result_file_key] = ""
-            self.attributes["error_file"] = error_path
-            self.attributes["error"] = (
-                f"Failed to generate isochrones for {self.workflow_name}: {e}"
-            )
-            return False
-        return json
+        Args:
+            e (Exception): The exception raised while fetching the isochrones.
+        """
+        # Write the traceback to error.txt in the workflow_directory
+        error_path = os.path.join(self.workflow_directory, "error.txt")
+        with open(error_path, "w") as f:
+            f.write(f"Failed to process {self.workflow_name}: {e}\n")
+            f.write(traceback.format_exc())
+
+        log_message(
+            f"Failed to fetch isochrones layer for {self.workflow_name}: {e}",
+            tag="Geest",
+            level=Qgis.Critical,
+        )
+        log_message(
+            traceback.format_exc(),
+            tag="Geest",
+            level=Qgis.Critical,
+        )
+        self.attributes[self.result_key] = f"{self.workflow_name} Workflow Error"
+        self.attributes[self.result_file_key] = ""
+        self.attributes["error_file"] = error_path
+        self.attributes["error"] = (
+            f"Failed to generate isochrones for {self.workflow_name}: {e}"
+        )
+
+    def _isochrone_cache_path(self, coordinates: list) -> str:
+        """
+        Get the cache file for an ORS isochrone request.
+
+        The file name is a hash of everything that affects the response: the
+        point coordinates (rounded to 6 decimal places), the travel mode, the
+        measurement and the distances.
+
+        Args:
+            coordinates (list): The [x, y] coordinates of the points, in EPSG:4326.
+
+        Returns:
+            str: Path of the cached JSON response, which may not exist yet.
+        """
+        request = {
+            "points": [[round(x, 6), round(y, 6)] for x, y in coordinates],
+            "mode": self.mode,
+            "measurement": self.measurement,
+            "distances": list(self.distances),
+        }
+        key = hashlib.blake2b(
+            json.dumps(request, sort_keys=True).encode("utf-8"), digest_size=16
+        ).hexdigest()
+        return os.path.join(self.isochrone_cache_directory, f"{key}.json")
 
     def _create_isochrone_layer(self, isochrone_data):
         """
@@ -549,24 +773,18 @@ class MultiBufferDistancesWorkflow(WorkflowBase):
             # Log message when the field is added
             log_message('Added "value" field to input layer')
 
-        # Calculate the burn field value based on the item number in the distance list
+        # Calculate the burn field value based on the item number in the distance list.
+        # The list should have max 5 values in it - later items are capped at 5 and the
+        # value is inverted so that closer distances have higher values.
+        scores = {}
+        for index, distance in enumerate(self.distances):
+            scores.setdefault(distance, 5 - min(index, 5))
+        log_message(f"Distance scores: {scores}", tag="Geest", level=Qgis.Info)
         layer.startEditing()
-        for i, feature in enumerate(layer.getFeatures()):
-            # Get the value of the burn field from the feature
-            distance_field_value = feature.attribute("distance")
-            # Get the index of the burn field value from the distances list
-            if distance_field_value in self.distances:
-                distance_field_index = self.distances.index(distance_field_value)
-                log_message(
-                    f"Found {distance_field_value} at index {distance_field_index}",
-                    tag="Geest",
-                    level=Qgis.Info,
-                )
-                # The list should have max 5 values in it. If the index is greater than 5, set it to 5
-                distance_field_index = min(distance_field_index, 5)
-                # Invert the value so that closer distances have higher values
-                distance_field_index = 5 - distance_field_index
-                feature.setAttribute("value", distance_field_index)
+        for feature in layer.getFeatures():
+            score = scores.get(feature.attribute("distance"))
+            if score is not None:
+                feature.setAttribute("value", score)
                 layer.updateFeature(feature)
         layer.commitChanges()
         return layer
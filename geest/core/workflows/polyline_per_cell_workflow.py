@@ -90,7 +90,9 @@ class PolylinePerCellWorkflow(WorkflowBase):
         output_path = os.path.join(
             self.workflow_directory, f"{self.layer_id}_grid_cells.gpkg"
         )
-        area_grid = select_grid_cells(self.grid_layer, area_features, output_path)
+        area_grid = select_grid_cells(
+            self.grid_layer, area_features, output_path, current_bbox.boundingBox()
+        )
 
         # Step 2: Assign values to grid cells
         grid = assign_values_to_grid(area_grid)
@@ -1,4 +1,8 @@
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from osgeo import gdal
 from qgis.core import (
     Qgis,
     QgsGeometry,
@@ -15,6 +19,13 @@ from geest.core import JsonTreeItem
 from geest.core.constants import GDAL_OUTPUT_DATA_TYPE
 from geest.utilities import log_message
 
+# Number of raster rows read, reclassified and written in one go
+RECLASSIFY_BLOCK_ROWS = 512
+# Value written for input pixels that are nodata
+RECLASSIFY_NO_DATA = -9999
+# Upper bound on the number of blocks reclassified concurrently
+RECLASSIFY_MAX_WORKERS = 4
+
 
 class RasterReclassificationWorkflow(WorkflowBase):
     """
@@ -225,19 +236,12 @@ class RasterReclassificationWorkflow(WorkflowBase):
             self.workflow_directory, f"{self.layer_id}_reclassified_{index}.tif"
         )
 
-        # Set up the reclassification using reclassifybytable
-        params = {
-            "INPUT_RASTER": input_raster,
-            "RASTER_BAND": 1,  # Band number to apply the reclassification
-            "TABLE": self.reclassification_rules,  # Reclassification table
-            "RANGE_BOUNDARIES": self.range_boundaries,
-            "OUTPUT": "TEMPORARY_OUTPUT",
-        }
-
-        # Perform the reclassification using the raster calculator
-        reclass = processing.run(
-            "native:reclassifybytable", params, feedback=QgsProcessingFeedback()
-        )["OUTPUT"]
+        reclass = self._reclassify_raster(
+            input_raster,
+            os.path.join(
+                self.workflow_directory, f"{self.layer_id}_reclass_{index}.tif"
+            ),
+        )
 
         clip_params = {
             "INPUT": reclass,
@@ -260,6 +264,116 @@ class RasterReclassificationWorkflow(WorkflowBase):
 
         return reclassified_raster_path
 
+    def _reclassify_raster(self, input_raster: str, output_path: str) -> str:
+        """
+        Reclassify the first band of a raster using the reclassification rules.
+
+        This mirrors native:reclassifybytable - the first matching range wins, values
+        outside every range are kept and nodata pixels stay nodata - but each range is
+        applied to a whole block of rows with numpy rather than pixel by pixel.
+
+        :input_raster: Path to the raster to reclassify.
+        :output_path: Path of the Float32 GeoTIFF to write.
+
+        :return: The output path.
+        """
+        source = gdal.Open(input_raster)
+        width = source.RasterXSize
+        height = source.RasterYSize
+
+        driver = gdal.GetDriverByName("GTiff")
+        target = driver.Create(
+            output_path,
+            width,
+            height,
+            1,
+            gdal.GDT_Float32,
+            options=["COMPRESS=DEFLATE", "TILED=YES"],
+        )
+        target.SetGeoTransform(source.GetGeoTransform())
+        target.SetProjection(source.GetProjection())
+        source = None
+        target_band = target.GetRasterBand(1)
+        target_band.SetNoDataValue(RECLASSIFY_NO_DATA)
+
+        # Blocks are reclassified on worker threads (GDAL reads and numpy both
+        # release the GIL) while this thread writes them out in order, as a
+        # GDAL dataset must not be written from several threads at once. At
+        # most two blocks per worker are in flight so memory use is bounded by
+        # the block size rather than the raster size.
+        workers = max(1, min(RECLASSIFY_MAX_WORKERS, os.cpu_count() or 1))
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for y_offset in range(0, height, RECLASSIFY_BLOCK_ROWS):
+                rows = min(RECLASSIFY_BLOCK_ROWS, height - y_offset)
+                pending.append(
+                    (
+                        y_offset,
+                        executor.submit(
+                            self._reclassify_block, input_raster, y_offset, rows
+                        ),
+                    )
+                )
+                if len(pending) >= 2 * workers:
+                    # Write the oldest block before submitting any more
+                    done_offset, future = pending.popleft()
+                    target_band.WriteArray(future.result(), 0, done_offset)
+            while pending:
+                done_offset, future = pending.popleft()
+                target_band.WriteArray(future.result(), 0, done_offset)
+
+        target_band.FlushCache()
+        target = None
+        return output_path
+
+    def _reclassify_block(self, input_raster: str, y_offset: int, rows: int):
+        """
+        Reclassify one block of rows from the first band of a raster.
+
+        Each call opens its own dataset handle so blocks can be read concurrently.
+
+        :input_raster: Path to the raster to reclassify.
+        :y_offset: First row of the block.
+        :rows: Number of rows in the block.
+
+        :return: A Float32 numpy array with the reclassified values.
+        """
+        # float() also turns the "-inf" / "inf" entries into usable bounds
+        rules = [float(rule) for rule in self.reclassification_rules]
+        ranges = [
+            (rules[i], rules[i + 1], rules[i + 2]) for i in range(0, len(rules), 3)
+        ]
+        include_minimum = self.range_boundaries in (1, 2)
+        include_maximum = self.range_boundaries in (0, 2)
+
+        source = gdal.Open(input_raster)
+        source_band = source.GetRasterBand(1)
+        source_no_data = source_band.GetNoDataValue()
+        raw = source_band.ReadAsArray(0, y_offset, source.RasterXSize, rows)
+        source = None
+
+        # Compare in double precision like native:reclassifybytable, so values
+        # close to a rule boundary fall in the same class. The result is only
+        # cast to Float32 for writing.
+        values = raw.astype(np.float64)
+        output = values.copy()
+        unmatched = np.ones(values.shape, dtype=bool)
+        for minimum, maximum, new_value in ranges:
+            above = values >= minimum if include_minimum else values > minimum
+            below = values <= maximum if include_maximum else values < maximum
+            matched = unmatched & above & below
+            output[matched] = new_value
+            unmatched &= ~matched
+        if source_no_data is not None:
+            if np.issubdtype(raw.dtype, np.floating):
+                no_data = raw == raw.dtype.type(source_no_data)
+            else:
+                # Integer nodata values may not fit the band type, e.g. -9999
+                no_data = values == source_no_data
+            output[no_data] = RECLASSIFY_NO_DATA
+        output[np.isnan(values)] = RECLASSIFY_NO_DATA
+        return output.astype(np.float32)
+
     # Not used in this workflow since we work with rasters
     def _process_features_for_area(
         self,
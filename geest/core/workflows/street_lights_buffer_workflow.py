@@ -103,7 +103,9 @@ class StreetLightsBufferWorkflow(WorkflowBase):
         output_path = os.path.join(
             self.workflow_directory, f"{self.layer_id}_grid_cells.gpkg"
         )
-        area_grid = select_grid_cells(self.grid_layer, area_features, output_path)
+        area_grid = select_grid_cells(
+            self.grid_layer, area_features, output_path, current_bbox.boundingBox()
+        )
 
         # Step 3: Assign scores to the grid layer
         grid_layer = self._score_grid(area_grid, buffered_layer)
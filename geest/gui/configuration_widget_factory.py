@@ -28,6 +28,24 @@ class ConfigurationWidgetFactory:
     based on the attributes dictionary.
     """
 
+    # Configuration widget class for each analysis mode key. The polygon,
+    # polyline and point per cell modes share a configuration widget but get
+    # different datasource widgets.
+    WIDGET_CLASSES = {
+        "use_index_score": IndexScoreConfigurationWidget,
+        "use_multi_buffer_point": MultiBufferConfigurationWidget,
+        "use_single_buffer_point": SingleBufferConfigurationWidget,
+        "use_polygon_per_cell": FeaturePerCellConfigurationWidget,
+        "use_polyline_per_cell": FeaturePerCellConfigurationWidget,
+        "use_point_per_cell": FeaturePerCellConfigurationWidget,
+        "use_csv_to_point_layer": AcledCsvConfigurationWidget,
+        "use_classify_polygon_into_classes": ClassifiedPolygonConfigurationWidget,
+        "use_classify_safety_polygon_into_classes": SafetyPolygonConfigurationWidget,
+        "use_nighttime_lights": SafetyRasterConfigurationWidget,
+        "use_environmental_hazards": RasterReclassificationConfigurationWidget,
+        "use_street_lights": StreetLightsConfigurationWidget,
+    }
+
     @staticmethod
     def create_widget(
         key: str, value: int, attributes: dict
@@ -43,65 +61,15 @@ class ConfigurationWidgetFactory:
                 return DontUseConfigurationWidget(
                     analysis_mode="Do Not Use", attributes=attributes
                 )
-            if key == "use_index_score" and value == 1:
-                return IndexScoreConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_multi_buffer_point" and value == 1:
-                return MultiBufferConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_single_buffer_point" and value == 1:
-                return SingleBufferConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            # ------------------------------------------------
-            # These three all use the same configuration widgets
-            # but will have different datasource widgets generated as appropriate
-            if key == "use_polygon_per_cell" and value == 1:  # poly = polygon
-                return FeaturePerCellConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_polyline_per_cell" and value == 1:
-                return FeaturePerCellConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_point_per_cell" and value == 1:
-                return FeaturePerCellConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_csv_to_point_layer" and value == 1:
-                return AcledCsvConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            # ------------------------------------------------
-            if key == "use_classify_polygon_into_classes" and value == 1:
-                return ClassifiedPolygonConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_classify_safety_polygon_into_classes" and value == 1:
-                return SafetyPolygonConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_nighttime_lights" and value == 1:
-                return SafetyRasterConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_environmental_hazards" and value == 1:
-                return RasterReclassificationConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            if key == "use_street_lights" and value == 1:
-                return StreetLightsConfigurationWidget(
-                    analysis_mode=key, attributes=attributes
-                )
-            else:
-                log_message(
-                    f"Factory did not match any widgets for key: {key}",
-                    tag="Geest",
-                    level=Qgis.Critical,
-                )
-                return None
+            widget_class = ConfigurationWidgetFactory.WIDGET_CLASSES.get(key)
+            if widget_class is not None and value == 1:
+                return widget_class(analysis_mode=key, attributes=attributes)
+            log_message(
+                f"Factory did not match any widgets for key: {key}",
+                tag="Geest",
+                level=Qgis.Critical,
+            )
+            return None
         except Exception as e:
             log_message(f"Error in create_radio_button: {e}", level=Qgis.Critical)
             import traceback
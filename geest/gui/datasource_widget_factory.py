@@ -18,6 +18,30 @@ class DataSourceWidgetFactory:
     Factory class for creating data source widgets based on key-value pairs.
     """
 
+    # Datasource widget class and the widget_key passed to it for each
+    # analysis mode key. Most widgets get the key without the "use_" prefix.
+    WIDGET_SPECS = {
+        "use_index_score": (FixedValueDataSourceWidget, "use_index_score"),
+        "use_multi_buffer_point": (VectorDataSourceWidget, "multi_buffer_point"),
+        "use_single_buffer_point": (VectorDataSourceWidget, "single_buffer_point"),
+        "use_polygon_per_cell": (VectorDataSourceWidget, "polygon_per_cell"),
+        "use_polyline_per_cell": (VectorDataSourceWidget, "polyline_per_cell"),
+        "use_point_per_cell": (VectorDataSourceWidget, "point_per_cell"),
+        "use_csv_point_per_cell": (CsvDataSourceWidget, "csv_point_per_cell"),
+        "use_csv_to_point_layer": (AcledCsvDataSourceWidget, "csv_to_point_layer"),
+        "use_classify_polygon_into_classes": (
+            VectorAndFieldDataSourceWidget,
+            "classify_polygon_into_classes",
+        ),
+        "use_classify_safety_polygon_into_classes": (
+            VectorAndFieldDataSourceWidget,
+            "classify_safety_polygon_into_classes",
+        ),
+        "use_nighttime_lights": (RasterDataSourceWidget, "nighttime_lights"),
+        "use_environmental_hazards": (RasterDataSourceWidget, "environmental_hazards"),
+        "use_street_lights": (VectorDataSourceWidget, "street_lights"),
+    }
+
     @staticmethod
     def create_widget(
         widget_key: str, value: int, attributes: dict
@@ -35,69 +59,18 @@ class DataSourceWidgetFactory:
         if verbose_mode:
             log_message(f"Key: {widget_key} Value: {value}")
         try:
-            # remove "use_" from start of widget key for passing to the datasource widget where needed
-            cleaned_key = widget_key[4:]
             if widget_key == "indicator_required" and value == 0:
                 return None
-            if widget_key == "use_index_score" and value == 1:
-                return FixedValueDataSourceWidget(
-                    widget_key=widget_key, attributes=attributes
-                )
-            if widget_key == "use_multi_buffer_point" and value == 1:
-                return VectorDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_single_buffer_point" and value == 1:
-                return VectorDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_polygon_per_cell" and value == 1:
-                return VectorDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_polyline_per_cell" and value == 1:
-                return VectorDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_point_per_cell" and value == 1:
-                return VectorDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_csv_point_per_cell" and value == 1:
-                return CsvDataSourceWidget(
-                    cleaned_key=widget_key, attributes=attributes
-                )
-            if widget_key == "use_csv_to_point_layer" and value == 1:
-                return AcledCsvDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_classify_polygon_into_classes" and value == 1:
-                return VectorAndFieldDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_classify_safety_polygon_into_classes" and value == 1:
-                return VectorAndFieldDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_nighttime_lights" and value == 1:
-                return RasterDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_environmental_hazards" and value == 1:
-                return RasterDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            if widget_key == "use_street_lights" and value == 1:
-                return VectorDataSourceWidget(
-                    widget_key=cleaned_key, attributes=attributes
-                )
-            else:
-                log_message(
-                    f"Datasource Factory did not match any widgets",
-                    tag="Geest",
-                    level=Qgis.Critical,
-                )
-                return None
+            spec = DataSourceWidgetFactory.WIDGET_SPECS.get(widget_key)
+            if spec is not None and value == 1:
+                widget_class, key = spec
+                return widget_class(widget_key=key, attributes=attributes)
+            log_message(
+                f"Datasource Factory did not match any widgets",
+                tag="Geest",
+                level=Qgis.Critical,
+            )
+            return None
         except Exception as e:
             log_message(f"Error in datasource widget: {e}", level=Qgis.Critical)
             import traceback
@@ -60,22 +60,31 @@ class FactorConfigurationWidget(QWidget):
         analysis_mode = attributes.get("analysis_mode", "")
         log_message(f"Creating radio buttons for analysis mode: {analysis_mode}")
         widget_count = 0
+        first_widget = None
+        widget_keys = ConfigurationWidgetFactory.WIDGET_CLASSES
+        create_widget = ConfigurationWidgetFactory.create_widget
+        add_button = self.button_group.addButton
+        add_widget = self.layout.addWidget
         for key, value in attributes.items():
-            if key.startswith("use_") or key == "indicator_required" and value == 1:
+            # Modes switched off for this indicator have no widget, skip them
+            # here rather than asking the factory for one
+            if value != 1:
+                continue
+            if key in widget_keys or key == "indicator_required":
                 log_message(f"Creating radio button for key: {key} with value: {value}")
                 # We pass a copy of the attributes dictionary to the widget factory
                 # so that we can update the attributes as needed
                 # The widget factory will update the attributes dictionary with new data
-                configuration_widget = ConfigurationWidgetFactory.create_widget(
-                    key, value, attributes.copy()
-                )
+                configuration_widget = create_widget(key, value, attributes.copy())
                 if configuration_widget:
                     self.widgets[key] = configuration_widget
                     widget_count += 1
+                    if first_widget is None:
+                        first_widget = configuration_widget
                     if key == analysis_mode:
                         configuration_widget.setChecked(True)
-                    self.button_group.addButton(configuration_widget.radio_button)
-                    self.layout.addWidget(configuration_widget)
+                    add_button(configuration_widget.radio_button)
+                    add_widget(configuration_widget)
                     configuration_widget.data_changed.connect(self.update_attributes)
                 else:
                     log_message(
@@ -83,9 +92,8 @@ class FactorConfigurationWidget(QWidget):
                         level=Qgis.Warning,
                     )
         checked_button = self.button_group.checkedButton()
-        if not checked_button:
-            default_radio = self.button_group.buttons()[0]
-            default_radio.setChecked(True)
+        if not checked_button and first_widget is not None:
+            first_widget.setChecked(True)
 
     def refresh_radio_buttons(self, attributes: dict) -> None:
         """
@@ -102,10 +110,13 @@ class FactorConfigurationWidget(QWidget):
         """
         Slot called when the selection in the radio button group changes.
         Emits the selection_changed signal.
+
+        The attributes have already been updated by the time this is called:
+        checking a radio button makes its widget emit data_changed, which is
+        connected to update_attributes.
         :param button: The button that was clicked.
         """
         log_message("Radio button selection changed")
-        self.update_attributes(self.button_group.checkedButton().parent().get_data())
         self.selection_changed.emit()
 
     def update_attributes(self, new_data: dict) -> None:
@@ -124,6 +135,10 @@ class FactorConfigurationWidget(QWidget):
         # Log the received data
         # log_message(f"Received new data: {new_data}", tag="Geest", level=Qgis.Info)
 
+        # Look each indicator up in the tree once for both passes below
+        get_item = self.item.getItemByGuid
+        indicators = [(guid, get_item(guid)) for guid in self.guids]
+
         # Identify changed attributes: keys present in new_data with differing or new values
         if not new_data:
             changed_attributes = {}
@@ -133,8 +148,7 @@ class FactorConfigurationWidget(QWidget):
                 for key in new_data
                 if key not in self.attributes or self.attributes[key] != new_data[key]
             }
-            for guid in self.guids:
-                indicator = self.item.getItemByGuid(guid)
+            for guid, indicator in indicators:
                 if indicator is not None:
                     indicator.setAnalysisMode(new_data.get("analysis_mode", ""))
 
@@ -150,8 +164,7 @@ class FactorConfigurationWidget(QWidget):
             return  # Exit early if there are no changes
 
         # Apply the changes to each indicator associated with the GUIDs
-        for guid in self.guids:
-            indicator = self.item.getItemByGuid(guid)
+        for guid, indicator in indicators:
             if indicator is not None:
                 indicator_attributes = indicator.attributes()
                 indicator_attributes.update(changed_attributes)
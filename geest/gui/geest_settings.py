@@ -61,6 +61,15 @@ class GeestSettings(FORM_CLASS, QgsOptionsPageWidget):
             self.ors_key_line_edit.setPlaceholderText("Enter your ORS API key here")
         ors_request_size = int(setting(key="ors_request_size", default=100))
         self.ors_request_size.setValue(ors_request_size)
+        ors_parallel_requests = int(setting(key="ors_parallel_requests", default=1))
+        self.ors_parallel_requests.setValue(ors_parallel_requests)
+        # Straight line buffers instead of ORS isochrones for distance multi buffers
+        multi_buffer_euclidean_distance = int(
+            setting(key="multi_buffer_euclidean_distance", default=0)
+        )
+        self.multi_buffer_euclidean_distance_checkbox.setChecked(
+            bool(multi_buffer_euclidean_distance)
+        )
 
     def apply(self):
         """Process the animation sequence.
@@ -84,6 +93,13 @@ class GeestSettings(FORM_CLASS, QgsOptionsPageWidget):
 
         set_setting(key="ors_key", value=self.ors_key_line_edit.text())
         set_setting(key="ors_request_size", value=self.ors_request_size.value())
+        set_setting(
+            key="ors_parallel_requests", value=self.ors_parallel_requests.value()
+        )
+        if self.multi_buffer_euclidean_distance_checkbox.isChecked():
+            set_setting(key="multi_buffer_euclidean_distance", value=1)
+        else:
+            set_setting(key="multi_buffer_euclidean_distance", value=0)
 
 
 class GeestOptionsFactory(QgsOptionsWidgetFactory):
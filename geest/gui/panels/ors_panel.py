@@ -62,7 +62,7 @@ class OrsPanel(FORM_CLASS, QWidget):
         try:
             checker = OrsCheckerTask(url="https://api.openrouteservice.org")
             task = self.queue_manager.add_task(checker)
-            task.job_finished.connect(lambda success: self.task_completed(success))
+            task.job_finished.connect(self.task_completed)
             self.queue_manager.start_processing()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error checking ORS key: {e}")
@@ -2,6 +2,7 @@ import json
 import os
 import shutil
 import traceback
+from contextlib import contextmanager
 from logging import getLogger
 from typing import Union, Dict, List
 from qgis.PyQt.QtWidgets import (
@@ -30,9 +31,11 @@ from qgis.PyQt.QtCore import (
     QSettings,
     pyqtSignal,
     QModelIndex,
+    QTimer,
 )
 from qgis.PyQt.QtGui import QMovie
 from qgis.PyQt.QtWidgets import QSizePolicy
+from qgis.utils import iface
 from qgis.core import (
     Qgis,
     QgsRasterLayer,
@@ -42,7 +45,6 @@ from qgis.core import (
     QgsFeedback,
     QgsProcessingContext,
 )
-from functools import partial
 from geest.gui.views import JsonTreeView, JsonTreeModel
 from geest.core import JsonTreeItem
 from geest.utilities import resources_path
@@ -69,11 +71,25 @@ class TreePanel(QWidget):
     switch_to_next_tab = pyqtSignal()  # Signal to notify the parent to switch tabs
     switch_to_previous_tab = pyqtSignal()  # Signal to notify the parent to switch tabs
 
+    # Layers of the study area GeoPackage that are added to the map
+    STUDY_AREA_LAYERS = (
+        "study_area_polygons",
+        "study_area_clip_polygons",
+        "study_area_grid",
+        "study_area_bboxes",
+        "study_area_bbox",
+    )
+
     def __init__(self, parent=None, json_file=None):
         super().__init__(parent)
 
         # Initialize the QueueManager
         self.working_directory = None
+        # Paths derived from the working directory, cached when it changes
+        self.model_path = None
+        self.study_area_gpkg_path = None
+        # (layer name, uri) pairs for the study area layers in the working directory
+        self._study_area_uris: List[tuple] = []
         pool_size = int(setting(key="render_thread_pool_size", default=1))
         self.queue_manager = WorkflowQueueManager(pool_size=pool_size)
         self.json_file = json_file
@@ -82,6 +98,43 @@ class TreePanel(QWidget):
             True  # saves time by not running models that have already been run
         )
         self.items_to_run = 0  # Count of items that need to be run
+        self._cell_size_m = None  # Cell size cached for the current run
+        # Items for each workflow stage of the current run
+        self._stage_items: Dict[str, List[JsonTreeItem]] = {}
+        # Map of id(WorkflowJob) -> JsonTreeItem for the queued tasks
+        self._task_items: Dict[int, JsonTreeItem] = {}
+        # QgsProject is a singleton, keep a handle to it rather than fetching
+        # it again every time a workflow result is added to the map
+        self._project = QgsProject.instance()
+        # Map of layer tree group path -> {layer source: layer id} so that we
+        # can find layers we already added without scanning the group
+        self._layer_source_index: Dict[tuple, Dict[str, str]] = {}
+        self._project.cleared.connect(self._layer_source_index.clear)
+        # Map of (top level group, layer source) -> layer id for every layer
+        # add_to_map has placed anywhere under that group
+        self._known_sources: Dict[tuple, str] = {}
+        self._project.cleared.connect(self._known_sources.clear)
+        # Map of layer tree group path -> QgsLayerTreeGroup for the groups that
+        # add_to_map places layers in. Any removal from the layer tree drops
+        # the cache so we never hold on to a deleted group.
+        self._group_cache: Dict[tuple, QgsLayerTreeGroup] = {}
+        self._project.cleared.connect(self._group_cache.clear)
+        self._project.layerTreeRoot().willRemoveChildren.connect(
+            lambda *args: self._group_cache.clear()
+        )
+
+        # Items whose row needs repainting. Updates are collected here and
+        # flushed at most once per frame (see _schedule_repaint).
+        self._repaint_pending = False
+        self._repaint_items: Dict[int, JsonTreeItem] = {}
+        # Number of workflows finished in the current run, shown in the
+        # overall progress bar when the repaint is flushed
+        self._completed_count = 0
+
+        # Throbber animations shown while workflows run, one per row height.
+        # They are built on first use and shared by all the running items.
+        self._throbber_path = resources_path("resources", "throbber.gif")
+        self._movie_pool: Dict[int, QMovie] = {}
 
         layout = QVBoxLayout()
 
@@ -121,9 +174,6 @@ class TreePanel(QWidget):
         self.treeView.setContextMenuPolicy(Qt.CustomContextMenu)
         self.treeView.customContextMenuRequested.connect(self.open_context_menu)
 
-        # Expand the whole tree by default
-        self.treeView.expandAll()
-
         # Set the second and third columns to the exact width of their contents
         self.treeView.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.treeView.header().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -268,24 +318,28 @@ class TreePanel(QWidget):
         self.run_only_incomplete = False
         # Remove every file in self.working_directory except
         # mode.json and the study_area folder
-        for filename in os.listdir(self.working_directory):
-            file_path = os.path.join(self.working_directory, filename)
-            if filename != "model.json" and filename != "study_area":
+        # scandir entries carry their file type so we avoid a stat per check
+        with os.scandir(self.working_directory) as entries:
+            for entry in entries:
+                if entry.name == "model.json" or entry.name == "study_area":
+                    continue
                 try:
-                    if os.path.isfile(file_path) or os.path.islink(file_path):
-                        os.unlink(file_path)
-                    elif os.path.isdir(file_path):
-                        shutil.rmtree(file_path)
+                    if entry.is_symlink() or entry.is_file():
+                        os.unlink(entry.path)
+                    elif entry.is_dir():
+                        shutil.rmtree(entry.path)
                 except Exception as e:
                     log_message(
-                        f"Failed to delete {file_path}. Reason: {e}",
+                        f"Failed to delete {entry.path}. Reason: {e}",
                         level=Qgis.Critical,
                     )
         # Also remove the Geest layer group in the QGIS Layers List
-        root = QgsProject.instance().layerTreeRoot()
+        root = self._project.layerTreeRoot()
         for child in root.children():
             if child.name() == "Geest":
                 root.removeChildNode(child)
+        self._layer_source_index.clear()
+        self._known_sources.clear()
         # Mark all items in the data model as not run
         item = self.model.rootItem
         item.clear(recursive=True)  # sets status to not run and blanks file path
@@ -301,20 +355,27 @@ class TreePanel(QWidget):
             level=Qgis.Info,
         )
         self.working_directory = new_directory
-        model_path = os.path.join(new_directory, "model.json")
+        self.model_path = os.path.join(new_directory, "model.json")
+        self.study_area_gpkg_path = os.path.join(
+            new_directory, "study_area", "study_area.gpkg"
+        )
+        self._study_area_uris = [
+            (layer_name, f"{self.study_area_gpkg_path}|layername={layer_name}")
+            for layer_name in self.STUDY_AREA_LAYERS
+        ]
+        model_path = self.model_path
 
-        project_path = QgsProject.instance().fileName()
+        project_path = self._project.fileName()
         if project_path:
             checksum = hash(project_path)
         else:
             checksum = None
 
-        if os.path.exists(model_path):
+        if os.path.isfile(model_path):
             try:
                 self.json_file = model_path
                 self.load_json()  # sets the class member json_data
-                self.model.loadJsonData(self.json_data)
-                self.treeView.expandAll()
+                self.load_model_data()
                 log_message(f"Loaded model.json from {model_path}")
 
                 # If this is a first time use of the analysis project lets set some things up
@@ -367,8 +428,7 @@ class TreePanel(QWidget):
                         level=Qgis.Critical,
                     )
             self.load_json()
-            self.model.loadJsonData(self.json_data)
-            self.treeView.expandAll()
+            self.load_model_data()
         # Collapse any factors that have only a single indicator
         self.treeView.collapse_single_nodes()
 
@@ -390,10 +450,9 @@ class TreePanel(QWidget):
         try:
             json_data = self.model.to_json()
 
-            save_path = os.path.join(self.working_directory, "model.json")
-            with open(save_path, "w") as f:
+            with open(self.model_path, "w") as f:
                 json.dump(json_data, f, indent=4)
-            log_message(f"Saved JSON model to {save_path}")
+            log_message(f"Saved JSON model to {self.model_path}")
         except Exception as e:
             log_message(f"Error saving JSON: {str(e)}", level=Qgis.Critical)
 
@@ -403,6 +462,21 @@ class TreePanel(QWidget):
             self.json_data = json.load(f)
             log_message(f"Loaded JSON data from {self.json_file}")
 
+    def load_model_data(self):
+        """Load self.json_data into the tree model and expand the tree.
+
+        The status and weight columns are switched to Interactive resizing
+        while the model is populated so that Qt does not recompute their
+        ResizeToContents width for every row, then sized once at the end.
+        """
+        header = self.treeView.header()
+        header.setSectionResizeMode(1, QHeaderView.Interactive)
+        header.setSectionResizeMode(2, QHeaderView.Interactive)
+        self.model.loadJsonData(self.json_data)
+        self.treeView.expandAll()
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
+
     def load_json_from_file(self):
         """Prompt the user to load a JSON file and update the tree."""
         json_file, _ = QFileDialog.getOpenFileName(
@@ -411,8 +485,7 @@ class TreePanel(QWidget):
         if json_file:
             self.json_file = json_file
             self.load_json()
-            self.model.loadJsonData(self.json_data)
-            self.treeView.expandAll()
+            self.load_model_data()
 
     def export_json_to_file(self):
         """Export the current tree data to a JSON file."""
@@ -910,28 +983,34 @@ class TreePanel(QWidget):
 
         Note that the area grid layer can be slow to draw!.
         """
-        gpkg_path = os.path.join(
-            self.working_directory, "study_area", "study_area.gpkg"
-        )
-        project = QgsProject.instance()
+        project = self._project
 
-        # Check if 'Geest' group exists, otherwise create it
-        root = project.layerTreeRoot()
-        geest_group = root.findGroup("Geest Study Area")
+        # Check if 'Geest Study Area' group exists, otherwise create it
+        group_key = ("Geest Study Area",)
+        geest_group = self._group_cache.get(group_key)
         if geest_group is None:
-            geest_group = root.insertGroup(
-                0, "Geest Study Area"
-            )  # Insert at the top of the layers panel
-
-        layers = [
-            "study_area_polygons",
-            "study_area_clip_polygons",
-            "study_area_grid",
-            "study_area_bboxes",
-            "study_area_bbox",
-        ]
-        for layer_name in layers:
-            gpkg_layer_path = f"{gpkg_path}|layername={layer_name}"
+            root = project.layerTreeRoot()
+            geest_group = root.findGroup("Geest Study Area")
+            if geest_group is None:
+                geest_group = root.insertGroup(
+                    0, "Geest Study Area"
+                )  # Insert at the top of the layers panel
+            self._group_cache[group_key] = geest_group
+
+        new_layers = []
+        for layer_name, gpkg_layer_path in self._study_area_uris:
+            # Check if a layer with the same data source exists in the correct group
+            # before opening the GeoPackage again
+            existing_layer = self._find_existing_layer(
+                group_key, geest_group, gpkg_layer_path
+            )
+
+            # If the layer exists, refresh it instead of removing and re-adding
+            if existing_layer is not None:
+                log_message(f"Refreshing existing layer: {existing_layer.name()}")
+                existing_layer.reload()
+                continue
+
             layer = QgsVectorLayer(gpkg_layer_path, layer_name, "ogr")
 
             if not layer.isValid():
@@ -949,26 +1028,59 @@ class TreePanel(QWidget):
             else:
                 print(f"Failed to apply QML style: {result[1]}")
 
-            # Check if a layer with the same data source exists in the correct group
-            existing_layer = None
-            for child in geest_group.children():
-                if isinstance(child, QgsLayerTreeGroup):
-                    continue
-                if child.layer().source() == gpkg_layer_path:
-                    existing_layer = child.layer()
-                    break
+            new_layers.append(layer)
 
-            # If the layer exists, refresh it instead of removing and re-adding
-            if existing_layer is not None:
-                log_message(f"Refreshing existing layer: {existing_layer.name()}")
-                existing_layer.reload()
-            else:
-                # Add the new layer to the appropriate subgroup
-                QgsProject.instance().addMapLayer(layer, False)
-                layer_tree_layer = geest_group.addLayer(layer)
-                log_message(
-                    f"Added layer: {layer.name()} to group: {geest_group.name()}"
-                )
+        if not new_layers:
+            return
+        # Register all the new layers with the project in one call so that
+        # layersAdded is only emitted once, then add them to the group
+        project.addMapLayers(new_layers, False)
+        for layer in new_layers:
+            geest_group.addLayer(layer)
+            self._index_layer(group_key, layer)
+            log_message(f"Added layer: {layer.name()} to group: {geest_group.name()}")
+
+    def _find_existing_layer(
+        self, group_key: tuple, group: QgsLayerTreeGroup, source: str
+    ):
+        """Find a layer with the given source in a layer tree group.
+
+        The group's layers are collected with findLayers() only the first
+        time the group is seen; after that the lookup is a dict probe. Cached entries are
+        verified against the layer tree since the user may have removed
+        the layer in the meantime.
+
+        :param group_key: Tuple of group names identifying the group.
+        :param group: The layer tree group to search.
+        :param source: The data source of the layer.
+        :return: The existing QgsMapLayer or None.
+        """
+        index = self._layer_source_index.get(group_key)
+        if index is None:
+            index = {}
+            # findLayers also returns layers in sub groups, only keep the
+            # ones that sit directly in this group
+            for layer_tree_layer in group.findLayers():
+                layer = layer_tree_layer.layer()
+                if layer is not None and layer_tree_layer.parent() == group:
+                    index[layer.source()] = layer.id()
+            self._layer_source_index[group_key] = index
+        layer_id = index.get(source)
+        if layer_id is None:
+            return None
+        layer_tree_layer = group.findLayer(layer_id)
+        if layer_tree_layer is None or layer_tree_layer.layer() is None:
+            del index[source]
+            return None
+        return layer_tree_layer.layer()
+
+    def _index_layer(self, group_key: tuple, layer):
+        """Record a layer added to a layer tree group in the source index.
+
+        :param group_key: Tuple of group names identifying the group.
+        :param layer: The QgsMapLayer that was added.
+        """
+        self._layer_source_index.setdefault(group_key, {})[layer.source()] = layer.id()
 
     def add_to_map(
         self, item, key="result_file", layer_name=None, qml_key=None, group="Geest"
@@ -978,6 +1090,22 @@ class TreePanel(QWidget):
         layer_uri = item.attribute(f"{key}")
         log_message(f"Adding {layer_uri} for key {key} to map")
         if layer_uri:
+            # If this source was already added, just refresh it rather than
+            # opening the data source again and walking the layer tree
+            source_key = (group, layer_uri)
+            layer_id = self._known_sources.get(source_key)
+            if layer_id is not None:
+                existing_layer = self._project.mapLayer(layer_id)
+                if existing_layer is not None:
+                    log_message(
+                        f"Refreshing existing layer: {existing_layer.name()}",
+                        tag="Geest",
+                        level=Qgis.Info,
+                    )
+                    existing_layer.reload()
+                    return
+                del self._known_sources[source_key]
+
             if not layer_name:
                 layer_name = item.data(0)
 
@@ -1000,82 +1128,108 @@ class TreePanel(QWidget):
                 )
                 return
 
-            project = QgsProject.instance()
+            # Creating groups and adding the layer fires a layer tree signal
+            # for every step, so hold off repainting the Layers panel until done
+            with self._layer_tree_updates_paused():
+                # Check if 'Geest' group exists, otherwise create it
+                group_key = (group,)
+                geest_group = self._group_cache.get(group_key)
+                if geest_group is None:
+                    root = self._project.layerTreeRoot()
+                    geest_group = root.findGroup(group)
+                    if geest_group is None:
+                        geest_group = root.insertGroup(
+                            0, group
+                        )  # Insert at the top of the layers panel
+                        geest_group.setIsMutuallyExclusive(
+                            True
+                        )  # Make the group mutually exclusive
+                    self._group_cache[group_key] = geest_group
+
+                # Traverse the tree view structure to determine the appropriate subgroup based on paths
+                path_list = item.getPaths()
+                parent_group = geest_group
+                # truncate the last item from the path list
+                # as we want to add the layer to the group
+                # that is the parent of the layer
+                path_list = path_list[:-1]
+
+                for path in path_list:
+                    group_key = group_key + (path,)
+                    sub_group = self._group_cache.get(group_key)
+                    if sub_group is None:
+                        sub_group = parent_group.findGroup(path)
+                        if sub_group is None:
+                            sub_group = parent_group.addGroup(path)
+                            sub_group.setIsMutuallyExclusive(
+                                True
+                            )  # Make each subgroup mutually exclusive
+                        self._group_cache[group_key] = sub_group
+
+                    parent_group = sub_group
+
+                # Check if a layer with the same data source exists in the correct group
+                existing_layer = self._find_existing_layer(
+                    group_key, parent_group, layer_uri
+                )
 
-            # Check if 'Geest' group exists, otherwise create it
-            root = project.layerTreeRoot()
-            geest_group = root.findGroup(group)
-            if geest_group is None:
-                geest_group = root.insertGroup(
-                    0, group
-                )  # Insert at the top of the layers panel
-                geest_group.setIsMutuallyExclusive(
-                    True
-                )  # Make the group mutually exclusive
-
-            # Traverse the tree view structure to determine the appropriate subgroup based on paths
-            path_list = item.getPaths()
-            parent_group = geest_group
-            # truncate the last item from the path list
-            # as we want to add the layer to the group
-            # that is the parent of the layer
-            path_list = path_list[:-1]
-
-            for path in path_list:
-                sub_group = parent_group.findGroup(path)
-                if sub_group is None:
-                    sub_group = parent_group.addGroup(path)
-                    sub_group.setIsMutuallyExclusive(
-                        True
-                    )  # Make each subgroup mutually exclusive
-
-                parent_group = sub_group
+                # If the layer exists, refresh it instead of removing and re-adding
+                if existing_layer is not None:
+                    log_message(
+                        f"Refreshing existing layer: {existing_layer.name()}",
+                        tag="Geest",
+                        level=Qgis.Info,
+                    )
+                    existing_layer.reload()
+                    self._known_sources[source_key] = existing_layer.id()
+                else:
+                    # Add the new layer to the appropriate subgroup
+                    self._project.addMapLayer(layer, False)
+                    layer_tree_layer = parent_group.addLayer(layer)
+                    self._index_layer(group_key, layer)
+                    self._known_sources[source_key] = layer.id()
+                    layer_tree_layer.setExpanded(
+                        False
+                    )  # Collapse the legend for the layer by default
+                    log_message(
+                        f"Added layer: {layer.name()} to group: {parent_group.name()}"
+                    )
 
-            # Check if a layer with the same data source exists in the correct group
-            existing_layer = None
-            for child in parent_group.children():
-                if isinstance(child, QgsLayerTreeGroup):
-                    continue
-                if child.layer().source() == layer_uri:
-                    existing_layer = child.layer()
-                    break
+                    # Ensure the layer and its parent groups are visible
+                    current_group = parent_group
+                    while current_group is not None:
+                        current_group.setExpanded(True)  # Expand the group
+                        current_group.setItemVisibilityChecked(
+                            True
+                        )  # Ensure the group is visible
+                        current_group = current_group.parent()
 
-            # If the layer exists, refresh it instead of removing and re-adding
-            if existing_layer is not None:
-                log_message(
-                    f"Refreshing existing layer: {existing_layer.name()}",
-                    tag="Geest",
-                    level=Qgis.Info,
-                )
-                existing_layer.reload()
-            else:
-                # Add the new layer to the appropriate subgroup
-                QgsProject.instance().addMapLayer(layer, False)
-                layer_tree_layer = parent_group.addLayer(layer)
-                layer_tree_layer.setExpanded(
-                    False
-                )  # Collapse the legend for the layer by default
-                log_message(
-                    f"Added layer: {layer.name()} to group: {parent_group.name()}"
-                )
+                    # Set the layer itself to be visible
+                    layer_tree_layer.setItemVisibilityChecked(True)
 
-                # Ensure the layer and its parent groups are visible
-                current_group = parent_group
-                while current_group is not None:
-                    current_group.setExpanded(True)  # Expand the group
-                    current_group.setItemVisibilityChecked(
-                        True
-                    )  # Ensure the group is visible
-                    current_group = current_group.parent()
+                    log_message(
+                        f"Layer {layer.name()} and its parent groups are now visible.",
+                        tag="Geest",
+                        level=Qgis.Info,
+                    )
 
-                # Set the layer itself to be visible
-                layer_tree_layer.setItemVisibilityChecked(True)
+    @contextmanager
+    def _layer_tree_updates_paused(self):
+        """Context manager that stops the QGIS Layers panel repainting.
 
-                log_message(
-                    f"Layer {layer.name()} and its parent groups are now visible.",
-                    tag="Geest",
-                    level=Qgis.Info,
-                )
+        The panel is repainted once when the block exits. Layer tree signals
+        are left alone since the layer tree model relies on them to stay in
+        sync with the project.
+        """
+        view = iface.layerTreeView() if iface is not None else None
+        if view is None or not view.updatesEnabled():
+            yield
+            return
+        view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            view.setUpdatesEnabled(True)
 
     def edit_analysis_aggregation(self, analysis_item):
         """Open the AnalysisAggregationDialog for editing the weightings of factors in the analysis."""
@@ -1131,27 +1285,34 @@ class TreePanel(QWidget):
         log_message("\n############################################")
         log_message(f"Starting {workflow_type} workflows")
         log_message("############################################\n")
-        if workflow_type == "indicators":
-            for item in self.model.rootItem.getDescendantIndicators(
-                include_completed=not self.run_only_incomplete, include_disabled=False
-            ):
-                self.queue_workflow_task(item, item.role)
-        elif workflow_type == "factors":
-            for item in self.model.rootItem.getDescendantFactors(
-                include_completed=not self.run_only_incomplete, include_disabled=False
-            ):
-                self.queue_workflow_task(item, item.role)
-        elif workflow_type == "dimensions":
-            for item in self.model.rootItem.getDescendantDimensions(
-                include_completed=not self.run_only_incomplete, include_disabled=False
-            ):
-                self.queue_workflow_task(item, item.role)
-        elif workflow_type == "analysis":
-            item = self.model.get_analysis_item()
+        if not self._stage_items:
+            self._bucket_stage_items()
+        items = self._stage_items.get(workflow_type)
+        if items is None:
+            return
+        if workflow_type == "analysis":
             log_message("############################################")
-            log_message(f"Starting analysis workflow for {item.data(0)}")
+            log_message(f"Starting analysis workflow for {items[0].data(0)}")
             log_message("############################################")
-            self.queue_workflow_task(item, item.role)
+        self.queue_workflow_tasks(items)
+
+    def _bucket_stage_items(self):
+        """Sort the items in the tree into the workflow stages in one pass.
+
+        The result is stored in self._stage_items, keyed by the workflow
+        type used by start_workflows.
+        """
+        items = self.model.rootItem.getDescendantsByRole(
+            ("indicator", "factor", "dimension"),
+            include_completed=not self.run_only_incomplete,
+            include_disabled=False,
+        )
+        self._stage_items = {
+            "indicators": items["indicator"],
+            "factors": items["factor"],
+            "dimensions": items["dimension"],
+            "analysis": [self.model.get_analysis_item()],
+        }
 
     def _count_workflows_to_run(self, parent_item=None):
         """
@@ -1166,13 +1327,22 @@ class TreePanel(QWidget):
         self.items_to_run = count
 
     def cell_size_m(self):
-        """Get the cell size in meters from the analysis item."""
-        cell_size_m = (
+        """Get the cell size in meters from the analysis item.
+
+        While the workflow queue is running the value is read once and
+        reused, since the analysis item does not change during a run.
+        """
+        if self._cell_size_m is not None:
+            return self._cell_size_m
+        return self._analysis_cell_size_m()
+
+    def _analysis_cell_size_m(self):
+        """Read the cell size in meters from the analysis item, bypassing the cache."""
+        return (
             self.model.get_analysis_item()
             .attributes()
             .get("analysis_cell_size_m", 100.0)
         )
-        return cell_size_m
 
     def queue_workflow_task(self, item, role):
         """Queue a workflow task based on the role of the item.
@@ -1180,31 +1350,99 @@ class TreePanel(QWidget):
         ⭐️ These calls all pass a reference of the item to the workflow task.
             The task directly modifies the item's properties to update the tree.
         """
-        task = None
+        if not self._prepare_workflow_item(item, role):
+            return
+        task = self.queue_manager.add_workflow(item, self.cell_size_m())
+        if task is None:
+            return
+        self._connect_workflow_task(task, item)
+
+    def queue_workflow_tasks(self, items):
+        """Queue a workflow task for each of the items, using their own role.
 
+        The items that need running are handed to the queue manager as a
+        single batch rather than one at a time.
+
+        :param items: List of JsonTreeItems to queue workflows for.
+        """
+        items = [item for item in items if self._prepare_workflow_item(item, item.role)]
+        if not items:
+            return
+        tasks = self.queue_manager.add_workflows(items, self.cell_size_m())
+        for task, item in zip(tasks, items):
+            self._connect_workflow_task(task, item)
+
+    def _prepare_workflow_item(self, item, role) -> bool:
+        """Check whether the item needs running and set its analysis mode.
+
+        :param item: The JsonTreeItem to prepare.
+        :param role: The role of the workflow being queued.
+        :return: False if the item should be skipped.
+        """
+        if role != item.role:
+            return False
         attributes = item.attributes()
         if attributes.get("result_file", None) and self.run_only_incomplete:
-            return
-        if role == item.role and role == "factor":
+            return False
+        if role == "factor":
             attributes["analysis_mode"] = "factor_aggregation"
-        if role == item.role and role == "dimension":
+        elif role == "dimension":
             attributes["analysis_mode"] = "dimension_aggregation"
-        if role == item.role and role == "analysis":
+        elif role == "analysis":
             attributes["analysis_mode"] = "analysis_aggregation"
-        task = self.queue_manager.add_workflow(item, self.cell_size_m())
-        if task is None:
-            return
+        return True
 
-        # Connect workflow signals to TreePanel slots
-        task.job_queued.connect(partial(self.on_workflow_created, item))
-        task.job_started.connect(partial(self.on_workflow_started, item))
-        task.job_canceled.connect(partial(self.on_workflow_completed, item, False))
-        task.job_finished.connect(
-            lambda success: self.on_workflow_completed(item, success)
-        )
+    def _connect_workflow_task(self, task, item):
+        """Connect the signals of a queued workflow task to TreePanel slots.
+
+        :param task: The WorkflowJob that was queued.
+        :param item: The JsonTreeItem the task runs for.
+        """
+        # Connect workflow signals to TreePanel slots. The slots look up the
+        # item from the sending task so no closure is needed per connection.
+        self._task_items[id(task)] = item
+        task.job_queued.connect(self._on_task_queued)
+        task.job_started.connect(self._on_task_started)
+        task.job_canceled.connect(self._on_task_canceled)
+        task.job_finished.connect(self._on_task_finished)
         # Hook up the QTask feedback signal to the progress bar
         task.progressChanged.connect(self.task_progress_updated)
 
+    @pyqtSlot()
+    def _on_task_queued(self):
+        """Forward the job_queued signal of a task to on_workflow_created."""
+        item = self._task_items.get(id(self.sender()))
+        if item is not None:
+            self.on_workflow_created(item)
+
+    @pyqtSlot()
+    def _on_task_started(self):
+        """Forward the job_started signal of a task to on_workflow_started."""
+        item = self._task_items.get(id(self.sender()))
+        if item is not None:
+            self.on_workflow_started(item)
+
+    @pyqtSlot()
+    def _on_task_canceled(self):
+        """Forward the job_canceled signal of a task to on_workflow_completed.
+
+        Like a finished task, a canceled task is dropped from the lookup table.
+        """
+        item = self._task_items.pop(id(self.sender()), None)
+        if item is not None:
+            self.on_workflow_completed(item, False)
+
+    @pyqtSlot(bool)
+    def _on_task_finished(self, success):
+        """Forward the job_finished signal of a task to on_workflow_completed.
+
+        The task is done with after this, so its item is dropped from the
+        lookup table.
+        """
+        item = self._task_items.pop(id(self.sender()), None)
+        if item is not None:
+            self.on_workflow_completed(item, success)
+
     def run_item(self, item, shift_pressed):
         """Run the item and the ones below it.
 
@@ -1235,17 +1473,12 @@ class TreePanel(QWidget):
         self.workflow_progress_bar.setVisible(True)
         self.help_button.setVisible(False)
         self.project_button.setVisible(False)
+        self._completed_count = 0
         self.overall_progress_bar.setValue(0)
         self.overall_progress_bar.setMaximum(self.items_to_run)
         self.workflow_progress_bar.setValue(0)
 
-        for indicator in indicators:
-            self.queue_workflow_task(indicator, indicator.role)
-        for factor in factors:
-            self.queue_workflow_task(factor, factor.role)
-        for dimension in dimensions:
-            self.queue_workflow_task(dimension, dimension.role)
-        self.queue_workflow_task(item, item.role)
+        self.queue_workflow_tasks(indicators + factors + dimensions + [item])
         self.items_to_run = len(indicators) + len(factors) + len(dimensions) + 1
 
         debug_env = int(os.getenv("GEEST_DEBUG", 0))
@@ -1281,10 +1514,8 @@ class TreePanel(QWidget):
         # Ensure we work with QModelIndex instead of QPersistentModelIndex
         child_index = QModelIndex(node_index)
 
-        # Get row height and prepare movies
+        # Get row height for the movie
         row_height = self.treeView.rowHeight(child_index)
-        self.child_movie = QMovie(resources_path("resources", "throbber.gif"))
-        self.parent_movie = QMovie(resources_path("resources", "throbber.gif"))
 
         # If this is an indicator, caclulate height for parent in case the indicator is hidden
         if item.role == "indicator":
@@ -1292,22 +1523,13 @@ class TreePanel(QWidget):
             parent_index = self.model.itemIndex(parent_item)
             row_height = self.treeView.rowHeight(parent_index)
 
-        # Scale movies
-        self.child_movie.setScaledSize(
-            self.child_movie.currentPixmap()
-            .size()
-            .scaled(row_height, row_height, Qt.KeepAspectRatio)
-        )
-        self.parent_movie.setScaledSize(
-            self.parent_movie.currentPixmap()
-            .size()
-            .scaled(row_height, row_height, Qt.KeepAspectRatio)
-        )
+        movie = self._throbber_movie(row_height)
 
         # Set animated icon for the child
         child_label = QLabel()
-        child_label.setMovie(self.child_movie)
-        self.child_movie.start()
+        child_label.setMovie(movie)
+        if movie.state() != QMovie.Running:
+            movie.start()
 
         # Place child animation
         second_column_index = self.model.index(
@@ -1323,8 +1545,7 @@ class TreePanel(QWidget):
                 if parent_index.isValid():
                     # Create parent animation
                     parent_label = QLabel()
-                    parent_label.setMovie(self.parent_movie)
-                    self.parent_movie.start()
+                    parent_label.setMovie(movie)
 
                     # Get parent's second column index
                     parent_second_column_index = self.model.index(
@@ -1337,8 +1558,63 @@ class TreePanel(QWidget):
                     )
                     parent_label.show()
 
-                    # Force immediate update
-                    self.treeView.viewport().update()
+                    self._schedule_repaint()
+
+    def _throbber_movie(self, row_height: int) -> QMovie:
+        """Return the shared throbber animation scaled for the given row height.
+
+        The GIF is only read and scaled the first time a row height is seen,
+        and its frames are cached so they are decoded once rather than on
+        every loop of the animation.
+
+        :param row_height: Height in pixels of the tree row showing the throbber.
+        """
+        movie = self._movie_pool.get(row_height)
+        if movie is None:
+            movie = QMovie(self._throbber_path, parent=self)
+            movie.setCacheMode(QMovie.CacheAll)
+            movie.setScaledSize(
+                movie.currentPixmap()
+                .size()
+                .scaled(row_height, row_height, Qt.KeepAspectRatio)
+            )
+            self._movie_pool[row_height] = movie
+        return movie
+
+    def _schedule_repaint(self, item: JsonTreeItem = None):
+        """Request a tree repaint, coalescing requests made in the same frame.
+
+        When workflows finish back to back, repainting the tree for every
+        one of them is wasted work. Instead the items are collected and
+        _flush_repaint is run once after a short delay.
+
+        :param item: Optional item whose status column changed.
+        """
+        if item is not None:
+            self._repaint_items[id(item)] = item
+        if self._repaint_pending:
+            return
+        self._repaint_pending = True
+        QTimer.singleShot(16, self._flush_repaint)
+
+    def _flush_repaint(self):
+        """Emit dataChanged for the collected items and repaint the tree once.
+
+        The overall progress bar is brought up to date at the same time.
+        """
+        self._repaint_pending = False
+        self.overall_progress_bar.setValue(self._completed_count)
+        items = list(self._repaint_items.values())
+        self._repaint_items.clear()
+        for item in items:
+            node_index = self.model.itemIndex(item)
+            if not node_index.isValid():
+                continue
+            second_column_index = self.model.index(
+                node_index.row(), 1, node_index.parent()
+            )
+            self.model.dataChanged.emit(second_column_index, second_column_index)
+        self.treeView.viewport().update()
 
     def task_progress_updated(self, progress):
         """Slot to be called when the task progress is updated."""
@@ -1351,7 +1627,8 @@ class TreePanel(QWidget):
         Slot for handling when a workflow is completed.
         Update the tree item to indicate success or failure.
         """
-        self.overall_progress_bar.setValue(self.overall_progress_bar.value() + 1)
+        self._completed_count += 1
+        self._schedule_repaint()
         self.workflow_progress_bar.setValue(0)
         self.save_json_to_working_directory()
 
@@ -1376,16 +1653,13 @@ class TreePanel(QWidget):
                 parent_index.row(), 1, parent_index.parent()
             )
 
-        self.child_movie.stop()
-        self.parent_movie.stop()
-
         second_column_index = self.model.index(node_index.row(), 1, node_index.parent())
         self.treeView.setIndexWidget(second_column_index, None)
         if parent_second_column_index:
             self.treeView.setIndexWidget(parent_second_column_index, None)
 
-        # Emit dataChanged to refresh the decoration
-        self.model.dataChanged.emit(second_column_index, second_column_index)
+        # Refresh the decoration on the next repaint
+        self._schedule_repaint(item)
 
         if item.role == "analysis":
             # Run some post processing on the analysis results
@@ -1409,9 +1683,7 @@ class TreePanel(QWidget):
         log_message(item.attributesAsMarkdown())
         # Prepare the population data if provided
         population_data = item.attribute("population_layer_source", None)
-        gpkg_path = os.path.join(
-            self.working_directory, "study_area", "study_area.gpkg"
-        )
+        gpkg_path = self.study_area_gpkg_path
         feedback = QgsFeedback()
         context = QgsProcessingContext()
         population_processor = PopulationRasterProcessingTask(
@@ -1522,10 +1794,13 @@ class TreePanel(QWidget):
         logical order of indicators then factors then dimensions, then the whole analysis.
         """
         self.workflow_queue = ["indicators", "factors", "dimensions", "analysis"]
+        self._cell_size_m = self._analysis_cell_size_m()
+        self._bucket_stage_items()
         self.overall_progress_bar.setVisible(True)
         self.workflow_progress_bar.setVisible(True)
         self.help_button.setVisible(False)
         self.project_button.setVisible(False)
+        self._completed_count = 0
         self.overall_progress_bar.setValue(0)
         self.overall_progress_bar.setMaximum(self.items_to_run)
         self.workflow_progress_bar.setValue(0)
@@ -1537,6 +1812,10 @@ class TreePanel(QWidget):
         If self.workflow_queue is empty, the function will return.
         """
         if len(self.workflow_queue) == 0:
+            self._cell_size_m = None
+            self._stage_items = {}
+            for movie in self._movie_pool.values():
+                movie.stop()
             self.overall_progress_bar.setVisible(False)
             self.workflow_progress_bar.setVisible(False)
             self.help_button.setVisible(True)
@@ -1555,22 +1834,12 @@ class TreePanel(QWidget):
         """
         :param index: QModelIndex - if None the root index is used
 
-        Recursively expand all nodes in the tree view starting from the root.
+        Expand all nodes in the tree view below (and including) the index.
+        Qt expands the whole branch in one call instead of one node at a time.
         """
         if self.treeView.model() is None:
             return
-        else:
-            model = self.treeView.model()
         if index is None:
-            index = model.index(0, 0, QModelIndex())
-
-        if not index.isValid():
-            return
-
-        self.treeView.expand(index)
-
-        # Loop through all children and expand them as well
-        row_count = self.treeView.model().rowCount(index)
-        for row in range(row_count):
-            child_index = self.treeView.model().index(row, 0, index)
-            self.expand_all_nodes(child_index)
+            self.treeView.expandAll()
+        elif index.isValid():
+            self.treeView.expandRecursively(index)
@@ -1,32 +1,70 @@
+import traceback
 import uuid
+from contextlib import contextmanager
 
-# Change to this when implementing in QGIS
 from qgis.PyQt.QtWidgets import (
-    QAbstractItemDelegate,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QTreeView,
     QMessageBox,
 )
-
-# Change to this when implementing in QGIS
 from qgis.PyQt.QtCore import (
     QAbstractItemModel,
     QModelIndex,
     Qt,
     pyqtSignal,
 )
-from qgis.PyQt.QtGui import QColor
-from qgis.PyQt.QtWidgets import QAbstractItemDelegate, QTreeView, QMessageBox
-from qgis.PyQt.QtCore import QAbstractItemModel, QModelIndex, Qt
+from qgis.PyQt.QtGui import QColor, QFontMetrics, QPalette
 from qgis.core import Qgis
 from geest.utilities import log_message
 from geest.core import JsonTreeItem
 
+# Font colors for the weighting column, created once and shared
+_COLOR_RED = QColor(Qt.red)
+
+# (attribute key, json key, default) for the attributes read from the json
+# for each dimension and factor
+_DIMENSION_FIELDS = (
+    ("id", "id", ""),
+    ("output_filename", "output_filename", ""),
+    ("name", "name", ""),
+    ("description", "description", ""),
+    ("default_analysis_weighting", "default_analysis_weighting", 0.0),
+    ("analysis_weighting", "analysis_weighting", 0.0),
+    ("analysis_mode", "factor_aggregation", ""),
+    ("result", "result", ""),
+    ("execution_start_time", "execution_start_time", ""),
+    ("result_file", "result_file", ""),
+    ("execution_end_time", "execution_end_time", ""),
+)
+_FACTOR_FIELDS = (
+    ("id", "id", ""),
+    ("output_filename", "output_filename", ""),
+    ("name", "name", ""),
+    ("description", "description", ""),
+    ("default_dimension_weighting", "default_dimension_weighting", 0.0),
+    ("dimension_weighting", "dimension_weighting", 0.0),
+    ("analysis_mode", "factor_aggregation", ""),
+    ("result", "result", ""),
+    ("execution_start_time", "execution_start_time", ""),
+    ("result_file", "result_file", ""),
+    ("execution_end_time", "execution_end_time", ""),
+)
+
 
 class JsonTreeModel(QAbstractItemModel):
     collapseNodeRequested = pyqtSignal(
         object
     )  # Signal to notify the view to collapse a node
 
+    # Custom role returning all the roles needed to paint a cell in one call
+    MultipleRoles = Qt.UserRole + 1
+
+    # Flags only depend on the column, so they are worked out once up front
+    _EDITABLE_FLAGS = Qt.ItemIsEditable | Qt.ItemIsSelectable | Qt.ItemIsEnabled
+    _COLUMN_FLAGS = (_EDITABLE_FLAGS, _EDITABLE_FLAGS)
+    _DEFAULT_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+
     """
     A custom tree model for managing hierarchical JSON data in a QTreeView, including an "Analysis" root item
     under which Dimensions, Factors, and Indicators are stored. Each tree item has attributes that store custom
@@ -53,6 +91,8 @@ class JsonTreeModel(QAbstractItemModel):
             ["GEEST2", "Status", "Weight"], role="root", guid=guid
         )
         self.original_value = None  # To store the original value before editing
+        # Views showing this model, registered by JsonTreeView.setModel
+        self._attached_views = []
         self.loadJsonData(json_data)
 
     def loadJsonData(self, json_data):
@@ -65,149 +105,177 @@ class JsonTreeModel(QAbstractItemModel):
         Args:
             json_data (dict): The JSON data representing the analysis and its hierarchical structure.
         """
-        self.beginResetModel()
-        self.rootItem = JsonTreeItem(["GEEST2", "Status", "Weight"], "root")
-
-        # Create the 'Analysis' parent item
-        analysis_name = json_data.get("analysis_name", "Analysis")
-        analysis_description = json_data.get("description", "No Description")
-        analysis_cell_size_m = json_data.get("analysis_cell_size_m", 100.0)
-        working_folder = json_data.get("working_folder", "Not Set")
-        guid = json_data.get("guid", str(uuid.uuid4()))  # Deserialize UUID
-        analysis_result = json_data.get("result", "")
-        analysis_execution_start_time = json_data.get("execution_start_time", "")
-        analysis_result_file = json_data.get("result_file", "")
-        analysis_execution_end_time = json_data.get("execution_end_time", "")
-        analysis_error = json_data.get("error", "")
-        analysis_error_file = json_data.get("error_file", "")
-        analysis_output_filename = json_data.get("output_filename", "WEE_Score")
-        mask_mode = json_data.get("mask_mode", "None")
-        buffer_distance_m = json_data.get("buffer_distance_m", 0.0)
-        opportunities_mask_result_file = json_data.get(
-            "opportunities_mask_result_file", ""
-        )
-        opportunities_mask_result = json_data.get("opportunities_mask_result", "")
-        wee_by_opportunities_mask_result = json_data.get(
-            "wee_by_opportunities_mask_result", ""
-        )
-        wee_by_opportunities_mask_result_file = json_data.get(
-            "wee_by_opportunities_mask_result_file", ""
-        )
-        wee_by_population = json_data.get("wee_by_population", "")
-        wee_by_population_subnational_aggregation = json_data.get(
-            "wee_by_population_subnational_aggregation", ""
-        )
-        wee_score_subnational_aggregation = json_data.get(
-            "wee_score_subnational_aggregation", ""
-        )
-        opportunities_by_wee_score_by_population_subnational_aggregation = (
-            json_data.get(
-                "opportunities_by_wee_score_by_population_subnational_aggregation", ""
+        with self._suspended_updates():
+            self.beginResetModel()
+            self.rootItem = JsonTreeItem(["GEEST2", "Status", "Weight"], "root")
+
+            # Create the 'Analysis' parent item
+            analysis_name = json_data.get("analysis_name", "Analysis")
+            analysis_description = json_data.get("description", "No Description")
+            analysis_cell_size_m = json_data.get("analysis_cell_size_m", 100.0)
+            working_folder = json_data.get("working_folder", "Not Set")
+            guid = json_data.get("guid", str(uuid.uuid4()))  # Deserialize UUID
+            analysis_result = json_data.get("result", "")
+            analysis_execution_start_time = json_data.get("execution_start_time", "")
+            analysis_result_file = json_data.get("result_file", "")
+            analysis_execution_end_time = json_data.get("execution_end_time", "")
+            analysis_error = json_data.get("error", "")
+            analysis_error_file = json_data.get("error_file", "")
+            analysis_output_filename = json_data.get("output_filename", "WEE_Score")
+            mask_mode = json_data.get("mask_mode", "None")
+            buffer_distance_m = json_data.get("buffer_distance_m", 0.0)
+            opportunities_mask_result_file = json_data.get(
+                "opportunities_mask_result_file", ""
             )
-        )
-        opportunities_by_wee_score_subnational_aggregation = json_data.get(
-            "opportunities_by_wee_score_subnational_aggregation", ""
-        )
-        wee_by_population_by_opportunities_mask_result_file = json_data.get(
-            "wee_by_population_by_opportunities_mask_result_file", ""
-        )
-        wee_by_population_by_opportunities_mask_result = json_data.get(
-            "wee_by_population_by_opportunities_mask_result", ""
-        )
-        # Store special properties in the attributes dictionary
-        analysis_attributes = {
-            "analysis_name": analysis_name,
-            "description": analysis_description,
-            "working_folder": working_folder,
-            "analysis_cell_size_m": analysis_cell_size_m,
-            "result": analysis_result,
-            "result_file": analysis_result_file,
-            "execution_start_time": analysis_execution_start_time,
-            "execution_end_time": analysis_execution_end_time,
-            "error": analysis_error,
-            "error_file": analysis_error_file,
-            "output_filename": analysis_output_filename,
-            "mask_mode": mask_mode,
-            "buffer_distance_m": buffer_distance_m,
-            "opportunities_mask_result_file": opportunities_mask_result_file,
-            "opportunities_mask_result": opportunities_mask_result,
-            "wee_by_opportunities_mask_result": wee_by_opportunities_mask_result,
-            "wee_by_opportunities_mask_result_file": wee_by_opportunities_mask_result_file,
-            "wee_by_population": wee_by_population,
-            "wee_by_population_subnational_aggregation": wee_by_population_subnational_aggregation,
-            "wee_score_subnational_aggregation": wee_score_subnational_aggregation,
-            "opportunities_by_wee_score_by_population_subnational_aggregation": opportunities_by_wee_score_by_population_subnational_aggregation,
-            "opportunities_by_wee_score_subnational_aggregation": opportunities_by_wee_score_subnational_aggregation,
-            "wee_by_population_by_opportunities_mask_result_file": wee_by_population_by_opportunities_mask_result_file,
-            "wee_by_population_by_opportunities_mask_result": wee_by_population_by_opportunities_mask_result,
-        }
-        for prefix in [
-            "aggregation",
-            "population",
-            "point_mask",
-            "polygon_mask",
-            "raster_mask",
-        ]:
-            analysis_attributes[f"{prefix}_layer"] = json_data.get(
-                f"{prefix}_layer", ""
+            opportunities_mask_result = json_data.get("opportunities_mask_result", "")
+            wee_by_opportunities_mask_result = json_data.get(
+                "wee_by_opportunities_mask_result", ""
+            )
+            wee_by_opportunities_mask_result_file = json_data.get(
+                "wee_by_opportunities_mask_result_file", ""
             )
-            analysis_attributes[f"{prefix}_layer_name"] = json_data.get(
-                f"{prefix}_layer_name", ""
+            wee_by_population = json_data.get("wee_by_population", "")
+            wee_by_population_subnational_aggregation = json_data.get(
+                "wee_by_population_subnational_aggregation", ""
             )
-            analysis_attributes[f"{prefix}_layer_source"] = json_data.get(
-                f"{prefix}_layer_source", ""
+            wee_score_subnational_aggregation = json_data.get(
+                "wee_score_subnational_aggregation", ""
             )
-            analysis_attributes[f"{prefix}_layer_provider_type"] = json_data.get(
-                f"{prefix}_layer_provider_type", ""
+            opportunities_by_wee_score_by_population_subnational_aggregation = (
+                json_data.get(
+                    "opportunities_by_wee_score_by_population_subnational_aggregation",
+                    "",
+                )
             )
-            analysis_attributes[f"{prefix}_layer_crs"] = json_data.get(
-                f"{prefix}_layer_crs", ""
+            opportunities_by_wee_score_subnational_aggregation = json_data.get(
+                "opportunities_by_wee_score_subnational_aggregation", ""
             )
-            analysis_attributes[f"{prefix}_layer_wkb_type"] = json_data.get(
-                f"{prefix}_layer_wkb_type", ""
+            wee_by_population_by_opportunities_mask_result_file = json_data.get(
+                "wee_by_population_by_opportunities_mask_result_file", ""
             )
-            analysis_attributes[f"{prefix}_layer_id"] = json_data.get(
-                f"{prefix}_layer_id", ""
+            wee_by_population_by_opportunities_mask_result = json_data.get(
+                "wee_by_population_by_opportunities_mask_result", ""
             )
-            if prefix == "raster_mask":
-                analysis_attributes[f"{prefix}_raster"] = json_data.get(
-                    f"{prefix}_raster", ""
+            # Store special properties in the attributes dictionary
+            analysis_attributes = {
+                "analysis_name": analysis_name,
+                "description": analysis_description,
+                "working_folder": working_folder,
+                "analysis_cell_size_m": analysis_cell_size_m,
+                "result": analysis_result,
+                "result_file": analysis_result_file,
+                "execution_start_time": analysis_execution_start_time,
+                "execution_end_time": analysis_execution_end_time,
+                "error": analysis_error,
+                "error_file": analysis_error_file,
+                "output_filename": analysis_output_filename,
+                "mask_mode": mask_mode,
+                "buffer_distance_m": buffer_distance_m,
+                "opportunities_mask_result_file": opportunities_mask_result_file,
+                "opportunities_mask_result": opportunities_mask_result,
+                "wee_by_opportunities_mask_result": wee_by_opportunities_mask_result,
+                "wee_by_opportunities_mask_result_file": wee_by_opportunities_mask_result_file,
+                "wee_by_population": wee_by_population,
+                "wee_by_population_subnational_aggregation": wee_by_population_subnational_aggregation,
+                "wee_score_subnational_aggregation": wee_score_subnational_aggregation,
+                "opportunities_by_wee_score_by_population_subnational_aggregation": opportunities_by_wee_score_by_population_subnational_aggregation,
+                "opportunities_by_wee_score_subnational_aggregation": opportunities_by_wee_score_subnational_aggregation,
+                "wee_by_population_by_opportunities_mask_result_file": wee_by_population_by_opportunities_mask_result_file,
+                "wee_by_population_by_opportunities_mask_result": wee_by_population_by_opportunities_mask_result,
+            }
+            for prefix in [
+                "aggregation",
+                "population",
+                "point_mask",
+                "polygon_mask",
+                "raster_mask",
+            ]:
+                analysis_attributes[f"{prefix}_layer"] = json_data.get(
+                    f"{prefix}_layer", ""
                 )
-            else:
-                analysis_attributes[f"{prefix}_shapefile"] = json_data.get(
-                    f"{prefix}_shapefile", ""
+                analysis_attributes[f"{prefix}_layer_name"] = json_data.get(
+                    f"{prefix}_layer_name", ""
+                )
+                analysis_attributes[f"{prefix}_layer_source"] = json_data.get(
+                    f"{prefix}_layer_source", ""
+                )
+                analysis_attributes[f"{prefix}_layer_provider_type"] = json_data.get(
+                    f"{prefix}_layer_provider_type", ""
+                )
+                analysis_attributes[f"{prefix}_layer_crs"] = json_data.get(
+                    f"{prefix}_layer_crs", ""
+                )
+                analysis_attributes[f"{prefix}_layer_wkb_type"] = json_data.get(
+                    f"{prefix}_layer_wkb_type", ""
                 )
+                analysis_attributes[f"{prefix}_layer_id"] = json_data.get(
+                    f"{prefix}_layer_id", ""
+                )
+                if prefix == "raster_mask":
+                    analysis_attributes[f"{prefix}_raster"] = json_data.get(
+                        f"{prefix}_raster", ""
+                    )
+                else:
+                    analysis_attributes[f"{prefix}_shapefile"] = json_data.get(
+                        f"{prefix}_shapefile", ""
+                    )
 
-        # Create the "Analysis" item
-        status = ""
-        weighting = ""
-        role = "analysis"
-        analysis_item = JsonTreeItem(
-            [
-                "WEE Score",
-                status,
-                weighting,
-                analysis_attributes,
-            ],
-            role=role,
-            guid=guid,
-            parent=self.rootItem,
-        )
-        self.rootItem.appendChild(analysis_item)
+            # Create the "Analysis" item
+            status = ""
+            weighting = ""
+            role = "analysis"
+            analysis_item = JsonTreeItem(
+                [
+                    "WEE Score",
+                    status,
+                    weighting,
+                    analysis_attributes,
+                ],
+                role=role,
+                guid=guid,
+                parent=self.rootItem,
+            )
+            self.rootItem.appendChild(analysis_item)
+
+            # Process dimensions, factors, and layers under the 'Analysis' parent item
+            for dimension in json_data.get("dimensions", []):
+                dimension_item = self._create_dimension_item(dimension, analysis_item)
+
+                # Process factors under each dimension
+                for factor in dimension.get("factors", []):
+                    factor_item = self._create_factor_item(factor, dimension_item)
 
-        # Process dimensions, factors, and layers under the 'Analysis' parent item
-        for dimension in json_data.get("dimensions", []):
-            dimension_item = self._create_dimension_item(dimension, analysis_item)
+                    # Process indicators (layers) under each factor
+                    for indicator in factor.get("indicators", []):
+                        self._create_indicator_item(indicator, factor_item)
 
-            # Process factors under each dimension
-            for factor in dimension.get("factors", []):
-                factor_item = self._create_factor_item(factor, dimension_item)
+            self.endResetModel()
 
-                # Process indicators (layers) under each factor
-                for indicator in factor.get("indicators", []):
-                    self._create_indicator_item(indicator, factor_item)
+    def attach_view(self, view):
+        """
+        Registers a view showing this model so that its painting can be
+        suspended during bulk changes.
 
-        self.endResetModel()
+        Args:
+            view (QAbstractItemView): The view to register.
+        """
+        if view not in self._attached_views:
+            self._attached_views.append(view)
+
+    @contextmanager
+    def _suspended_updates(self):
+        """
+        Context manager that disables painting of the attached views for the
+        duration of a bulk change, so they repaint once when it is done.
+        """
+        suspended = [view for view in self._attached_views if view.updatesEnabled()]
+        for view in suspended:
+            view.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            for view in suspended:
+                view.setUpdatesEnabled(True)
 
     def get_analysis_item(self):
         """
@@ -231,19 +299,8 @@ class JsonTreeModel(QAbstractItemModel):
         """
         dimension_name = dimension["name"].title()  # Title case for dimensions
         dimension_attributes = {
-            "id": dimension.get("id", ""),
-            "output_filename": dimension.get("output_filename", ""),
-            "name": dimension.get("name", ""),
-            "description": dimension.get("description", ""),
-            "default_analysis_weighting": dimension.get(
-                "default_analysis_weighting", 0.0
-            ),
-            "analysis_weighting": dimension.get("analysis_weighting", 0.0),
-            "analysis_mode": dimension.get("factor_aggregation", ""),
-            "result": dimension.get("result", ""),
-            "execution_start_time": dimension.get("execution_start_time", ""),
-            "result_file": dimension.get("result_file", ""),
-            "execution_end_time": dimension.get("execution_end_time", ""),
+            key: dimension.get(json_key, default)
+            for key, json_key, default in _DIMENSION_FIELDS
         }
         guid = dimension.get("guid", str(uuid.uuid4()))  # Deserialize UUID
 
@@ -252,7 +309,7 @@ class JsonTreeModel(QAbstractItemModel):
             [
                 dimension_name,
                 status,
-                dimension.get("analysis_weighting", 0),
+                dimension_attributes["analysis_weighting"],
                 dimension_attributes,
             ],
             role="dimension",
@@ -275,19 +332,8 @@ class JsonTreeModel(QAbstractItemModel):
             JsonTreeItem: The created factor item.
         """
         factor_attributes = {
-            "id": factor.get("id", ""),
-            "output_filename": factor.get("output_filename", ""),
-            "name": factor.get("name", ""),
-            "description": factor.get("description", ""),
-            "default_dimension_weighting": factor.get(
-                "default_dimension_weighting", 0.0
-            ),
-            "dimension_weighting": factor.get("dimension_weighting", 0.0),
-            "analysis_mode": factor.get("factor_aggregation", ""),
-            "result": factor.get("result", ""),
-            "execution_start_time": factor.get("execution_start_time", ""),
-            "result_file": factor.get("result_file", ""),
-            "execution_end_time": factor.get("execution_end_time", ""),
+            key: factor.get(json_key, default)
+            for key, json_key, default in _FACTOR_FIELDS
         }
         status = ""  # Use item.getStatus to get after constructing the item
         guid = factor.get("guid", str(uuid.uuid4()))  # Deserialize UUID
@@ -295,7 +341,7 @@ class JsonTreeModel(QAbstractItemModel):
             [
                 factor["name"],
                 status,
-                factor.get("dimension_weighting", 0),
+                factor_attributes["dimension_weighting"],
                 factor_attributes,
             ],
             role="factor",
@@ -336,22 +382,48 @@ class JsonTreeModel(QAbstractItemModel):
         """
         Toggles the visibility of all indicator nodes in the tree.
 
+        Only visible items are exposed as rows, so hiding or showing indicators is
+        reported to the view as a removal or insertion of rows under each affected
+        parent rather than as a change to the layout of the whole tree.
+
         Args:
             visible (bool): Whether to show or hide the indicator nodes.
             parent_item (JsonTreeItem): Optional parent item to start from. If None, start from root.
         """
 
         parent_item = parent_item if parent_item else self.rootItem
-        for i in range(parent_item.childCount()):
-            child_item = parent_item.child(i)
-            if child_item.role == "indicator":
-                child_item.set_visibility(visible)
-            else:
-                # Recursively process children (dimensions, factors)
-                self.toggle_indicator_visibility(visible, child_item)
-
-        # Notify view about layout changes
-        self.layoutChanged.emit()
+        stack = [parent_item]
+        while stack:
+            item = stack.pop()
+            indicators = []
+            rows_before = 0
+            rows_after = 0
+            for child_item in item.childItems:
+                if child_item.is_visible():
+                    rows_before += 1
+                if child_item.role == "indicator":
+                    indicators.append(child_item)
+                    if visible:
+                        rows_after += 1
+                else:
+                    # Process children (dimensions, factors) too
+                    stack.append(child_item)
+                    if child_item.is_visible():
+                        rows_after += 1
+            if not indicators:
+                continue
+
+            parent_index = self._index_for_item(item)
+            if rows_after < rows_before:
+                self.beginRemoveRows(parent_index, rows_after, rows_before - 1)
+            elif rows_after > rows_before:
+                self.beginInsertRows(parent_index, rows_before, rows_after - 1)
+            for indicator in indicators:
+                indicator.set_visibility(visible)
+            if rows_after < rows_before:
+                self.endRemoveRows()
+            elif rows_after > rows_before:
+                self.endInsertRows()
 
     def data(self, index, role):
         """
@@ -374,12 +446,11 @@ class JsonTreeModel(QAbstractItemModel):
         if not item.is_visible():
             return None
 
-        # Existing data handling code
-        if role == Qt.DisplayRole:
-            return item.data(index.column())
+        if role == self.MultipleRoles:
+            return self._paint_data(item, index.column())
 
         if role == Qt.DisplayRole:
-            return item.data(index.column())
+            return self._display_value(item, index.column())
         elif role == Qt.ForegroundRole and index.column() == 2:
             return item.font_color
         elif (
@@ -399,6 +470,54 @@ class JsonTreeModel(QAbstractItemModel):
 
         return None
 
+    def _display_value(self, item, column):
+        """
+        Returns the value shown for the item in the given column. Weightings are
+        stored as numbers and only formatted here.
+
+        Args:
+            item (JsonTreeItem): The item being displayed.
+            column (int): The column being displayed.
+
+        Returns:
+            The display value.
+        """
+        if column == 2:
+            value = item.data(column)
+            if isinstance(value, float):
+                return f"{value:.2f}"
+            return value
+        # Read the name and status straight from the item's data list, this is
+        # called for every painted cell
+        item_data = item.itemData
+        if column < len(item_data):
+            return item_data[column]
+        return None
+
+    def _paint_data(self, item, column):
+        """
+        Returns the data for all the roles used when painting a cell, so that the
+        delegate can fetch them with a single call to data().
+
+        Args:
+            item (JsonTreeItem): The item being painted.
+            column (int): The column being painted.
+
+        Returns:
+            dict: The data for each paint role, keyed by role.
+        """
+        decoration = None
+        if column == 0:
+            decoration = item.getIcon()
+        elif column == 1:
+            decoration = item.getStatusIcon()
+        return {
+            Qt.DisplayRole: self._display_value(item, column),
+            Qt.ForegroundRole: item.font_color if column == 2 else None,
+            Qt.DecorationRole: decoration,
+            Qt.FontRole: item.getFont(),
+        }
+
     def setData(self, index, value, role=Qt.EditRole):
         """
         Sets the data for the specified index and role, handling value validation (e.g., ensuring weightings are numbers).
@@ -418,7 +537,6 @@ class JsonTreeModel(QAbstractItemModel):
             if column == 2:  # tree_view column
                 try:
                     value = float(value)
-                    return item.setData(column, f"{value:.2f}")
                 except ValueError:
                     QMessageBox.critical(
                         None,
@@ -426,8 +544,23 @@ class JsonTreeModel(QAbstractItemModel):
                         "Please enter a valid number for the weighting.",
                     )
                     return False
-
-            return item.setData(column, value)
+                # Weightings are stored at full precision, but the editor starts
+                # from the two decimal display text, so getting that text back
+                # (e.g. 0.33 for 1/3) means the weighting was not edited
+                current = item.data(column)
+                unchanged = value == current or (
+                    isinstance(current, float) and value == float(f"{current:.2f}")
+                )
+            else:
+                unchanged = item.data(column) == value
+
+            # Nothing to do if the editor closed without a real edit
+            if unchanged:
+                return True
+            if not item.setData(column, value):
+                return False
+            self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+            return True
         return False
 
     def flags(self, index):
@@ -443,64 +576,82 @@ class JsonTreeModel(QAbstractItemModel):
         if not index.isValid():
             return Qt.NoItemFlags
 
-        item = index.internalPointer()
-        if index.column() == 0 or index.column() == 1:
-            return Qt.ItemIsEditable | Qt.ItemIsSelectable | Qt.ItemIsEnabled
-
-        return Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        column = index.column()
+        if column < len(self._COLUMN_FLAGS):
+            return self._COLUMN_FLAGS[column]
+        return self._DEFAULT_FLAGS
 
     def to_json(self):
         """
-        Converts the tree structure back into a JSON document, recursively traversing the tree and including
+        Converts the tree structure back into a JSON document, walking the tree iteratively and including
         the custom attributes stored in `attributes` for each item. UUIDs are serialized for all items.
 
         Returns:
             dict: The JSON representation of the tree structure.
         """
 
-        def recurse_tree(item):
-            # Serialize each item, including UUID
+        def serialize_item(item, children):
+            # Serialize a single item, including UUID, given its serialized children
+            attributes = item.attributes()
             if item.role == "analysis":
                 json_data = {
-                    "analysis_name": item.attribute("analysis_name"),
-                    "description": item.attribute("description"),
-                    "working_folder": item.attribute("working_folder"),
-                    "analysis_cell_size_m": item.attribute("analysis_cell_size_m"),
+                    "analysis_name": attributes.get("analysis_name"),
+                    "description": attributes.get("description"),
+                    "working_folder": attributes.get("working_folder"),
+                    "analysis_cell_size_m": attributes.get("analysis_cell_size_m"),
                     "guid": item.guid,  # Serialize UUID
-                    "dimensions": [recurse_tree(child) for child in item.childItems],
+                    "dimensions": children,
                 }
-                json_data.update(item.attributes())
+                json_data.update(attributes)
                 return json_data
             elif item.role == "dimension":
                 json_data = {
                     "name": item.data(0).lower(),
                     "guid": item.guid,  # Serialize UUID
-                    "factors": [recurse_tree(child) for child in item.childItems],
+                    "factors": children,
                     "analysis_weighting": item.data(2),
-                    "description": item.attribute("description"),
+                    "description": attributes.get("description"),
                 }
-                json_data.update(item.attributes())
+                json_data.update(attributes)
                 return json_data
             elif item.role == "factor":
                 json_data = {
                     "name": item.data(0),
                     "guid": item.guid,  # Serialize UUID
-                    "indicators": [recurse_tree(child) for child in item.childItems],
+                    "indicators": children,
                     "dimension_weighting": item.data(2),
                 }
-                json_data.update(item.attributes())
+                json_data.update(attributes)
                 return json_data
             elif item.role == "indicator":
-                json_data = item.attributes()
+                json_data = attributes
                 json_data["factor_weighting"] = item.data(2)
                 json_data["guid"] = item.guid  # Serialize UUID
                 return json_data
 
+        def serialize_tree(top_item):
+            # Walk the tree in post-order with an explicit stack so each item is
+            # serialized once, after all of its children
+            results = []
+            stack = [(top_item, False)]
+            while stack:
+                item, children_done = stack.pop()
+                if not children_done:
+                    stack.append((item, True))
+                    stack.extend((child, False) for child in reversed(item.childItems))
+                    continue
+                child_count = len(item.childItems)
+                if child_count:
+                    children = results[-child_count:]
+                    del results[-child_count:]
+                else:
+                    children = []
+                results.append(serialize_item(item, children))
+            return results[0]
+
         try:
-            return recurse_tree(self.rootItem.child(0))  # Start from the root item
+            return serialize_tree(self.rootItem.child(0))  # Start from the root item
         except Exception as e:
-            import traceback
-
             log_message(
                 f"Error converting tree to JSON: {e}",
                 tag="Geest",
@@ -512,7 +663,7 @@ class JsonTreeModel(QAbstractItemModel):
 
     def clear_factor_weightings(self, dimension_item):
         """
-        Clears all weightings for factors under the given dimension item, setting them to "0.00".
+        Clears all weightings for factors under the given dimension item, setting them to 0.
         Also updates the dimension's total weighting and font color to red.
 
         Args:
@@ -521,13 +672,14 @@ class JsonTreeModel(QAbstractItemModel):
         Returns:
             None
         """
-        for i in range(dimension_item.childCount()):
-            factor_item = dimension_item.child(i)
-            factor_item.setData(2, "0.00")
-        # Update the dimension's total weighting
-        dimension_item.setData(2, "0.00")
-        self.update_font_color(dimension_item, QColor(Qt.red))
-        self.layoutChanged.emit()
+        with self._suspended_updates():
+            for i in range(dimension_item.childCount()):
+                factor_item = dimension_item.child(i)
+                factor_item.setData(2, 0.0)
+            # Update the dimension's total weighting
+            dimension_item.setData(2, 0.0)
+            self._weightings_changed(dimension_item)
+            self.update_font_color(dimension_item, _COLOR_RED)
 
     def auto_assign_factor_weightings(self, dimension_item):
         """
@@ -540,21 +692,22 @@ class JsonTreeModel(QAbstractItemModel):
         Returns:
             None
         """
-        num_factors = dimension_item.childCount()
-        if num_factors == 0:
-            return
-        factor_weighting = 1 / num_factors
-        for i in range(num_factors):
-            factor_item = dimension_item.child(i)
-            factor_item.setData(2, f"{factor_weighting:.2f}")
-        # Update the dimension's total weighting
-        dimension_item.setData(2, "1.00")
-        # self.update_font_color(dimension_item, QColor(Qt.green))
-        self.layoutChanged.emit()
+        with self._suspended_updates():
+            num_factors = dimension_item.childCount()
+            if num_factors == 0:
+                return
+            factor_weighting = 1 / num_factors
+            for i in range(num_factors):
+                factor_item = dimension_item.child(i)
+                factor_item.setData(2, factor_weighting)
+            # Update the dimension's total weighting
+            dimension_item.setData(2, 1.0)
+            # self.update_font_color(dimension_item, QColor(Qt.green))
+            self._weightings_changed(dimension_item)
 
     def clear_layer_weightings(self, factor_item):
         """
-        Clears all weightings for layers (indicators) under the given factor item, setting them to "0.00".
+        Clears all weightings for layers (indicators) under the given factor item, setting them to 0.
         Also updates the factor's total weighting and font color to red.
 
         Args:
@@ -563,13 +716,14 @@ class JsonTreeModel(QAbstractItemModel):
         Returns:
             None
         """
-        for i in range(factor_item.childCount()):
-            layer_item = factor_item.child(i)
-            layer_item.setData(2, "0.00")
-        # Update the factor's total weighting
-        factor_item.setData(2, "0.00")
-        self.update_font_color(factor_item, QColor(Qt.red))
-        self.layoutChanged.emit()
+        with self._suspended_updates():
+            for i in range(factor_item.childCount()):
+                layer_item = factor_item.child(i)
+                layer_item.setData(2, 0.0)
+            # Update the factor's total weighting
+            factor_item.setData(2, 0.0)
+            self._weightings_changed(factor_item)
+            self.update_font_color(factor_item, _COLOR_RED)
 
     def auto_assign_layer_weightings(self, factor_item):
         """
@@ -582,17 +736,50 @@ class JsonTreeModel(QAbstractItemModel):
         Returns:
             None
         """
-        num_layers = factor_item.childCount()
-        if num_layers == 0:
-            return
-        layer_weighting = 1 / num_layers
-        for i in range(num_layers):
-            layer_item = factor_item.child(i)
-            layer_item.setData(2, f"{layer_weighting:.2f}")
-        # Update the factor's total weighting
-        factor_item.setData(2, "1.00")
-        # self.update_font_color(factor_item, QColor(Qt.green))
-        self.layoutChanged.emit()
+        with self._suspended_updates():
+            num_layers = factor_item.childCount()
+            if num_layers == 0:
+                return
+            layer_weighting = 1 / num_layers
+            for i in range(num_layers):
+                layer_item = factor_item.child(i)
+                layer_item.setData(2, layer_weighting)
+            # Update the factor's total weighting
+            factor_item.setData(2, 1.0)
+            # self.update_font_color(factor_item, QColor(Qt.green))
+            self._weightings_changed(factor_item)
+
+    def update_font_color(self, item, color):
+        """
+        Sets the font color used for the weighting column of the given item.
+
+        Args:
+            item (JsonTreeItem): The item to update.
+            color (QColor): The new font color.
+        """
+        item.font_color = color
+        if item is not self.rootItem:
+            index = self.createIndex(item.row(), 2, item)
+            self.dataChanged.emit(index, index, [Qt.ForegroundRole])
+
+    def _weightings_changed(self, parent_item):
+        """
+        Notifies the views that the weighting column of parent_item and of its
+        children has changed.
+
+        Args:
+            parent_item (JsonTreeItem): The item whose children were re-weighted.
+        """
+        roles = [Qt.DisplayRole, Qt.ForegroundRole]
+        # Only visible children are exposed as rows
+        rows = sum(1 for child in parent_item.childItems if child.is_visible())
+        if rows:
+            top = self.createIndex(0, 2, parent_item.child(0))
+            bottom = self.createIndex(rows - 1, 2, parent_item.child(rows - 1))
+            self.dataChanged.emit(top, bottom, roles)
+        if parent_item is not self.rootItem:
+            index = self.createIndex(parent_item.row(), 2, parent_item)
+            self.dataChanged.emit(index, index, roles)
 
     def add_factor(self, dimension_item):
         """
@@ -604,9 +791,10 @@ class JsonTreeModel(QAbstractItemModel):
         Returns:
             None
         """
-        new_factor = JsonTreeItem(["New Factor", "x", ""], "factor", dimension_item)
-        dimension_item.appendChild(new_factor)
-        self.layoutChanged.emit()
+        new_factor = JsonTreeItem(
+            ["New Factor", "x", ""], "factor", parent=dimension_item
+        )
+        self._append_item(new_factor, dimension_item)
 
     def add_indicator(self, factor_item):
         """
@@ -618,9 +806,10 @@ class JsonTreeModel(QAbstractItemModel):
         Returns:
             None
         """
-        indicator = JsonTreeItem(["New Layer", "x", "1.00"], "indicator", factor_item)
-        factor_item.appendChild(indicator)
-        self.layoutChanged.emit()
+        indicator = JsonTreeItem(
+            ["New Layer", "x", "1.00"], "indicator", parent=factor_item
+        )
+        self._append_item(indicator, factor_item)
 
     def remove_item(self, item):
         """
@@ -634,8 +823,39 @@ class JsonTreeModel(QAbstractItemModel):
         """
         parent = item.parent()
         if parent:
-            parent.childItems.remove(item)
-        self.layoutChanged.emit()
+            row = item.row()
+            self.beginRemoveRows(self._index_for_item(parent), row, row)
+            parent.removeChildren(row)
+            self.endRemoveRows()
+
+    def _index_for_item(self, item):
+        """
+        Returns the column 0 QModelIndex for the given item without searching the tree.
+
+        Args:
+            item (JsonTreeItem): The item to create an index for.
+
+        Returns:
+            QModelIndex: The index of the item, or an invalid index for the root item.
+        """
+        if item is None or item is self.rootItem:
+            return QModelIndex()
+        return self.createIndex(item.row(), 0, item)
+
+    def _append_item(self, item, parent_item):
+        """
+        Appends an item to the end of parent_item's children, notifying attached
+        views with beginInsertRows/endInsertRows so that selection and expansion
+        state is preserved.
+
+        Args:
+            item (JsonTreeItem): The item to append.
+            parent_item (JsonTreeItem): The item that will own the new child.
+        """
+        row = parent_item.childCount()
+        self.beginInsertRows(self._index_for_item(parent_item), row, row)
+        parent_item.appendChild(item)
+        self.endInsertRows()
 
     def rowCount(self, parent=QModelIndex()):
         """
@@ -655,6 +875,23 @@ class JsonTreeModel(QAbstractItemModel):
         # Count only visible items
         return len([child for child in parentItem.childItems if child.is_visible()])
 
+    def hasChildren(self, parent=QModelIndex()):
+        """
+        Returns whether the given parent has any visible children, without
+        counting all of them as rowCount does.
+
+        Args:
+            parent (QModelIndex): The parent index.
+
+        Returns:
+            bool: True if the parent has at least one visible child.
+        """
+        if not parent.isValid():
+            parentItem = self.rootItem
+        else:
+            parentItem = parent.internalPointer()
+        return any(child.is_visible() for child in parentItem.childItems)
+
     def columnCount(self, parent=QModelIndex()):
         """
         Returns the number of columns in the model. The number of columns is fixed to match the root item.
@@ -791,24 +1028,67 @@ class JsonTreeModel(QAbstractItemModel):
         Returns:
             None
         """
-        new_dimension = JsonTreeItem([name, "x", ""], "dimension", self.rootItem)
-        self.rootItem.appendChild(new_dimension)
-        self.layoutChanged.emit()
+        new_dimension = JsonTreeItem([name, "x", ""], "dimension", parent=self.rootItem)
+        self._append_item(new_dimension, self.rootItem)
 
-    def removeRow(self, row, parent=QModelIndex()):
+    def removeRows(self, row, count, parent=QModelIndex()):
         """
-        Removes the specified row from the model. This is primarily used for removing dimensions.
+        Removes count rows starting with the given row under parent from the model.
+        This is primarily used for removing dimensions.
 
         Args:
-            row (int): The row to be removed.
+            row (int): The first row to be removed.
+            count (int): The number of rows to remove.
             parent (QModelIndex): The parent index.
 
         Returns:
-            bool: True if the row was successfully removed, False otherwise.
+            bool: True if the rows were successfully removed, False otherwise.
         """
         parentItem = self.rootItem if not parent.isValid() else parent.internalPointer()
-        parentItem.childItems.pop(row)
-        self.layoutChanged.emit()
+        if count < 1 or row < 0 or row + count > parentItem.childCount():
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        parentItem.removeChildren(row, count)
+        self.endRemoveRows()
+        return True
+
+
+class JsonTreeDelegate(QStyledItemDelegate):
+    """
+    Item delegate that fetches all the paint roles for a cell with a single
+    call to JsonTreeModel.data() using JsonTreeModel.MultipleRoles, rather than
+    one call per role.
+    """
+
+    def initStyleOption(self, option: QStyleOptionViewItem, index: QModelIndex):
+        """
+        Initialises the style option for the index from the MultipleRoles data.
+
+        Args:
+            option (QStyleOptionViewItem): The option to initialise.
+            index (QModelIndex): The index being painted.
+        """
+        roles = index.data(JsonTreeModel.MultipleRoles)
+        if not isinstance(roles, dict):
+            super().initStyleOption(option, index)
+            return
+
+        option.index = index
+        font = roles[Qt.FontRole]
+        if font is not None:
+            option.font = font
+            option.fontMetrics = QFontMetrics(font)
+        color = roles[Qt.ForegroundRole]
+        if color is not None:
+            option.palette.setColor(QPalette.Text, color)
+        icon = roles[Qt.DecorationRole]
+        if icon is not None:
+            option.features |= QStyleOptionViewItem.HasDecoration
+            option.icon = icon
+        value = roles[Qt.DisplayRole]
+        if value is not None:
+            option.features |= QStyleOptionViewItem.HasDisplay
+            option.text = self.displayText(value, option.locale)
 
 
 class JsonTreeView(QTreeView):
@@ -816,10 +1096,11 @@ class JsonTreeView(QTreeView):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setItemDelegate(JsonTreeDelegate(self))
 
     def setModel(self, model: QAbstractItemModel):
         """
-        Override setModel to connect signals after setting the model.
+        Override setModel to connect signals after setting the model and expand the tree.
 
         Args:
             model (QAbstractItemModel): The model to set for the tree view.
@@ -827,6 +1108,10 @@ class JsonTreeView(QTreeView):
         super().setModel(model)
         # Connect the collapseNodeRequested signal after setting the model
         model.collapseNodeRequested.connect(self.collapse_node_in_view)
+        # Let the model suspend painting of this view during bulk changes
+        model.attach_view(self)
+        # Expand the whole tree in one go rather than node by node
+        self.expandAll()
 
     def collapse_single_nodes(self, parent_item=None):
         """
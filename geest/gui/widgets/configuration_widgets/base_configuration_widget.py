@@ -1,5 +1,12 @@
+import traceback
 from abc import abstractmethod
-from qgis.PyQt.QtWidgets import QRadioButton, QVBoxLayout, QWidget, QSizePolicy
+from qgis.PyQt.QtWidgets import (
+    QLabel,
+    QRadioButton,
+    QVBoxLayout,
+    QWidget,
+    QSizePolicy,
+)
 from qgis.PyQt.QtCore import pyqtSignal
 from qgis.core import Qgis
 from geest.utilities import log_message
@@ -15,6 +22,10 @@ class BaseConfigurationWidget(QWidget):
 
     data_changed = pyqtSignal(dict)
 
+    # Optional text shown in the internal container. The label is only built
+    # the first time the option is selected, since most options never are.
+    INFO_TEXT: str = None
+
     def __init__(
         self,
         analysis_mode: str,
@@ -52,6 +63,7 @@ class BaseConfigurationWidget(QWidget):
         self.internal_layout: QVBoxLayout = QVBoxLayout(self.internal_container)
         self.internal_layout.setContentsMargins(0, 0, 0, 0)
         self.layout.addWidget(self.internal_container)
+        self.info_label: QLabel = None
 
         # Signal handling
         self.radio_button.toggled.connect(self.on_toggled)
@@ -65,8 +77,6 @@ class BaseConfigurationWidget(QWidget):
             self.add_internal_widgets()
         except Exception as e:
             log_message(f"Error in add_internal_widgets: {e}", level=Qgis.Critical)
-            import traceback
-
             log_message(traceback.format_exc(), level=Qgis.Critical)
 
     def isChecked(self) -> bool:
@@ -122,8 +132,6 @@ class BaseConfigurationWidget(QWidget):
                 self.data_changed.emit(data)
             except Exception as e:
                 log_message(f"Error in update_data: {e}", level=Qgis.Critical)
-                import traceback
-
                 log_message(traceback.format_exc(), level=Qgis.Critical)
 
     def on_toggled(self, checked: bool) -> None:
@@ -132,6 +140,8 @@ class BaseConfigurationWidget(QWidget):
         Enables/disables internal widgets based on the radio button state.
         """
         log_message(f"Radio button toggled: {checked}")
+        if checked:
+            self._ensure_info_label()
         # self.set_internal_widgets_enabled(checked)
         self.internal_container.setVisible(checked)
         self.updateGeometry()
@@ -139,6 +149,15 @@ class BaseConfigurationWidget(QWidget):
         if checked:
             self.update_data()
 
+    def _ensure_info_label(self) -> None:
+        """
+        Creates the label showing INFO_TEXT at the top of the internal container,
+        if the subclass defines one and it has not been created yet.
+        """
+        if self.INFO_TEXT and self.info_label is None:
+            self.info_label = QLabel(self.INFO_TEXT)
+            self.internal_layout.insertWidget(0, self.info_label)
+
     @abstractmethod
     def set_internal_widgets_enabled(self, enabled: bool) -> None:
         """
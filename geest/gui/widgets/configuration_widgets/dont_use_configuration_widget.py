@@ -3,7 +3,8 @@ from .base_configuration_widget import BaseConfigurationWidget
 
 class DontUseConfigurationWidget(BaseConfigurationWidget):
     """
-    A specialized radio button with additional widgets for IndexScore.
+    A radio button for excluding an indicator from the analysis. It has no
+    internal widgets and passes the attributes through unchanged.
     """
 
     def add_internal_widgets(self) -> None:
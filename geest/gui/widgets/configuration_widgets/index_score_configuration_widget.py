@@ -1,4 +1,4 @@
-from qgis.PyQt.QtWidgets import QLabel, QDoubleSpinBox
+from qgis.PyQt.QtWidgets import QDoubleSpinBox
 from .base_configuration_widget import BaseConfigurationWidget
 from qgis.core import Qgis
 from geest.utilities import log_message
@@ -9,17 +9,16 @@ class IndexScoreConfigurationWidget(BaseConfigurationWidget):
     A specialized radio button with additional widgets for IndexScore.
     """
 
+    INFO_TEXT = "Fill each polygon with a fixed value"
+
     def add_internal_widgets(self) -> None:
         """
         Adds internal widgets specific to IndexScore.
+
+        The only internal widget is the INFO_TEXT label, which the base class
+        creates when the option is first selected.
         """
-        try:
-            self.info_label: QLabel = QLabel("Fill each polygon with a fixed value")
-            self.internal_layout.addWidget(self.info_label)
-        except Exception as e:
-            log_message(
-                f"Error in add_internal_widgets: {e}", "Geest", level=Qgis.Critical
-            )
+        pass
 
     def get_data(self) -> dict:
         """
@@ -32,7 +31,8 @@ class IndexScoreConfigurationWidget(BaseConfigurationWidget):
         Enables or disables the internal widgets based on the state of the radio button.
         """
         try:
-            self.info_label.setEnabled(enabled)
+            if self.info_label is not None:
+                self.info_label.setEnabled(enabled)
         except Exception as e:
             log_message(
                 f"Error in set_internal_widgets_enabled: {e}",
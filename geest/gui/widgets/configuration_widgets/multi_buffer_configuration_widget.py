@@ -19,73 +19,76 @@ class MultiBufferConfigurationWidget(BaseConfigurationWidget):
     def add_internal_widgets(self) -> None:
         """
         Adds internal widgets specific to self.set_internal_widgets_visible(self.isChecked()) - in this case there are none.
-        """
-        try:
-            log_message("Adding internal widgets for MultiBufferConfigurationWidget")
-            # log_message(f"Attributes: {self.attributes}")
-            # Travel Mode group
-            self.travel_mode_group = QGroupBox("Travel Mode:")
-            self.travel_mode_layout = QHBoxLayout()
-            self.walking_radio = QRadioButton("Walking")
-            self.driving_radio = QRadioButton("Driving")
-            if self.attributes.get("multi_buffer_travel_mode", "") != "Driving":
-                self.walking_radio.setChecked(True)
-            else:
-                self.driving_radio.setChecked(True)  # Default selection
-            self.travel_mode_layout.addWidget(self.walking_radio)
-            self.travel_mode_layout.addWidget(self.driving_radio)
-            self.travel_mode_group.setLayout(self.travel_mode_layout)
-
-            # Measurement group
-            self.measurement_group = QGroupBox("Measurement:")
-            self.measurement_layout = QHBoxLayout()
-            self.distance_radio = QRadioButton("Distance (meters)")
-            self.time_radio = QRadioButton("Time (minutes)")
-            if self.attributes.get("multi_buffer_travel_units", "") != "Time":
-                self.distance_radio.setChecked(True)
-            else:
-                self.time_radio.setChecked(True)  # Default selection
-            self.measurement_layout.addWidget(self.distance_radio)
-            self.measurement_layout.addWidget(self.time_radio)
-            self.measurement_group.setLayout(self.measurement_layout)
-
-            # Travel Increments input
-            self.travel_increments_layout = QHBoxLayout()
-            self.increments_label = QLabel("Travel Increments:")
-            self.increments_input = QLineEdit("")
-            self.travel_increments_layout.addWidget(self.increments_label)
-            self.travel_increments_layout.addWidget(self.increments_input)
-            if self.attributes.get("multi_buffer_travel_distances", False):
-                self.increments_input.setText(
-                    self.attributes["multi_buffer_travel_distances"]
-                )
-            else:
-                self.increments_input.setText(
-                    self.attributes.get("default_multi_buffer_distances", "")
-                )
-
-            # Add all layouts to the main layout
-            self.internal_layout.addWidget(self.travel_mode_group)
-            self.internal_layout.addWidget(self.measurement_group)
-            self.internal_layout.addLayout(self.travel_increments_layout)
 
-            # Emit the data_changed signal when any widget is changed
-            self.time_radio.toggled.connect(self.update_data)
-            self.distance_radio.toggled.connect(self.update_data)
-            self.walking_radio.toggled.connect(self.update_data)
-            self.driving_radio.toggled.connect(self.update_data)
-            self.increments_input.textChanged.connect(self.update_data)
-
-            # Connect the validation method to radio buttons to revalidate on state change
-            self.time_radio.toggled.connect(self.validate_increments_input)
-            self.distance_radio.toggled.connect(self.validate_increments_input)
-            self.increments_input.textChanged.connect(self.validate_increments_input)
+        Errors raised here are logged by BaseConfigurationWidget.
+        """
+        log_message("Adding internal widgets for MultiBufferConfigurationWidget")
+        self._build_travel_mode_group()
+        self._build_measurement_group()
+        self._build_increments_layout()
+
+        # Add all layouts to the main layout
+        self.internal_layout.addWidget(self.travel_mode_group)
+        self.internal_layout.addWidget(self.measurement_group)
+        self.internal_layout.addLayout(self.travel_increments_layout)
+
+        # Emit the data_changed signal when any widget is changed
+        self.time_radio.toggled.connect(self.update_data)
+        self.distance_radio.toggled.connect(self.update_data)
+        self.walking_radio.toggled.connect(self.update_data)
+        self.driving_radio.toggled.connect(self.update_data)
+        self.increments_input.textChanged.connect(self.update_data)
+
+        # Connect the validation method to radio buttons to revalidate on state change
+        self.time_radio.toggled.connect(self.validate_increments_input)
+        self.distance_radio.toggled.connect(self.validate_increments_input)
+        self.increments_input.textChanged.connect(self.validate_increments_input)
+
+    def _build_travel_mode_group(self) -> None:
+        """
+        Creates the walking / driving travel mode group.
+        """
+        self.travel_mode_group = QGroupBox("Travel Mode:")
+        self.travel_mode_layout = QHBoxLayout()
+        self.walking_radio = QRadioButton("Walking")
+        self.driving_radio = QRadioButton("Driving")
+        if self.attributes.get("multi_buffer_travel_mode", "") != "Driving":
+            self.walking_radio.setChecked(True)
+        else:
+            self.driving_radio.setChecked(True)  # Default selection
+        self.travel_mode_layout.addWidget(self.walking_radio)
+        self.travel_mode_layout.addWidget(self.driving_radio)
+        self.travel_mode_group.setLayout(self.travel_mode_layout)
 
-        except Exception as e:
-            log_message(f"Error in add_internal_widgets: {e}", level=Qgis.Critical)
-            import traceback
+    def _build_measurement_group(self) -> None:
+        """
+        Creates the distance / time measurement group.
+        """
+        self.measurement_group = QGroupBox("Measurement:")
+        self.measurement_layout = QHBoxLayout()
+        self.distance_radio = QRadioButton("Distance (meters)")
+        self.time_radio = QRadioButton("Time (minutes)")
+        if self.attributes.get("multi_buffer_travel_units", "") != "Time":
+            self.distance_radio.setChecked(True)
+        else:
+            self.time_radio.setChecked(True)  # Default selection
+        self.measurement_layout.addWidget(self.distance_radio)
+        self.measurement_layout.addWidget(self.time_radio)
+        self.measurement_group.setLayout(self.measurement_layout)
 
-            log_message(traceback.format_exc(), level=Qgis.Critical)
+    def _build_increments_layout(self) -> None:
+        """
+        Creates the travel increments label and line edit.
+        """
+        self.travel_increments_layout = QHBoxLayout()
+        self.increments_label = QLabel("Travel Increments:")
+        self.increments_input = QLineEdit("")
+        self.travel_increments_layout.addWidget(self.increments_label)
+        self.travel_increments_layout.addWidget(self.increments_input)
+        travel_distances = self.attributes.get(
+            "multi_buffer_travel_distances"
+        ) or self.attributes.get("default_multi_buffer_distances", "")
+        self.increments_input.setText(travel_distances)
 
     def validate_increments_input(self) -> bool:
         """
@@ -165,7 +168,17 @@ class MultiBufferConfigurationWidget(BaseConfigurationWidget):
         else:
             self.attributes["multi_buffer_travel_units"] = "Time"
 
-        self.attributes["multi_buffer_travel_distances"] = self.increments_input.text()
+        increments = self.increments_input.text()
+        self.attributes["multi_buffer_travel_distances"] = increments
+        # Parse the increments once here so the workflow does not need to
+        # re-parse the text. Invalid input is already flagged on the line edit
+        # by validate_increments_input, so no parsed value is stored for it.
+        try:
+            self.attributes["multi_buffer_travel_distances_parsed"] = sorted(
+                float(value.strip()) for value in increments.split(",")
+            )
+        except ValueError:
+            self.attributes.pop("multi_buffer_travel_distances_parsed", None)
 
         return self.attributes
 
@@ -1,6 +1,3 @@
-from qgis.PyQt.QtWidgets import (
-    QLabel,
-)
 from qgis.core import Qgis
 from .base_configuration_widget import BaseConfigurationWidget
 from geest.utilities import log_message
@@ -14,19 +11,17 @@ class RasterReclassificationConfigurationWidget(BaseConfigurationWidget):
     Currently does not provide any configuration options, only layer selection.
     """
 
+    INFO_TEXT = "Classify raster layer"
+
     def add_internal_widgets(self) -> None:
         """
         Adds the internal widgets required for selecting raster layers and their correspondings.
-        This method is called during the widget initialization and sets up the layout for the UI components.
-        """
-        try:
-            self.info_label = QLabel("Classify raster layer")
-            self.internal_layout.addWidget(self.info_label)
-        except Exception as e:
-            log_message(f"Error in add_internal_widgets: {e}", level=Qgis.Critical)
-            import traceback
+        This method is called during the widget initialization.
 
-            log_message(traceback.format_exc(), level=Qgis.Critical)
+        The only internal widget is the INFO_TEXT label, which the base class
+        creates when the option is first selected.
+        """
+        pass
 
     def get_data(self) -> dict:
         """
@@ -47,7 +42,8 @@ class RasterReclassificationConfigurationWidget(BaseConfigurationWidget):
             enabled (bool): Whether to enable or disable the internal widgets.
         """
         try:
-            self.info_label.setEnabled(enabled)
+            if self.info_label is not None:
+                self.info_label.setEnabled(enabled)
         except Exception as e:
             log_message(
                 f"Error in set_internal_widgets_enabled: {e}",
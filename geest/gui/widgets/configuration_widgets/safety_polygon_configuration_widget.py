@@ -69,7 +69,11 @@ class SafetyPolygonConfigurationWidget(BaseConfigurationWidget):
             safety_classes = {}
             # remove any item from the safety_classes where the key is not a string
         safety_classes = {k: v for k, v in safety_classes.items() if isinstance(k, str)}
-        self.table_widget.setRowCount(len(safety_classes))
+        table = self.table_widget
+        table.setRowCount(len(safety_classes))
+        row_count = table.rowCount()
+        set_item = table.setItem
+        set_cell_widget = table.setCellWidget
 
         def validate_value(value):
             return 0 <= value <= 100
@@ -77,7 +81,7 @@ class SafetyPolygonConfigurationWidget(BaseConfigurationWidget):
         log_message(f"Classes: {safety_classes}")
         # iterate over the dict and populate the table
         for row, (class_name, value) in enumerate(safety_classes.items()):
-            if row >= self.table_widget.rowCount():
+            if row >= row_count:
                 continue
 
             if not isinstance(class_name, str):
@@ -88,10 +92,10 @@ class SafetyPolygonConfigurationWidget(BaseConfigurationWidget):
 
             name_item = QTableWidgetItem(class_name)
             value_item = QSpinBox()
-            self.table_widget.setItem(row, 0, name_item)
+            set_item(row, 0, name_item)
             value_item.setRange(0, 100)  # Set spinner range
             value_item.setValue(value)  # Default value
-            self.table_widget.setCellWidget(row, 1, value_item)
+            set_cell_widget(row, 1, value_item)
 
             def on_value_changed(value):
                 # Color handling for current cell
@@ -105,8 +109,8 @@ class SafetyPolygonConfigurationWidget(BaseConfigurationWidget):
 
             value_item.valueChanged.connect(on_value_changed)
 
-            # Call update_cell_colors after all rows are created
-            self.update_cell_colors()
+        # Call update_cell_colors after all rows are created
+        self.update_cell_colors()
 
     def update_cell_colors(self):
         # Check if all values are zero
@@ -1,6 +1,4 @@
-from qgis.PyQt.QtWidgets import (
-    QLabel,
-)
+from qgis.core import Qgis
 from .base_configuration_widget import BaseConfigurationWidget
 from geest.utilities import log_message
 
@@ -11,20 +9,17 @@ class SafetyRasterConfigurationWidget(BaseConfigurationWidget):
     A widget for configuring safety indicators based on a raster.
     """
 
+    INFO_TEXT = "A raster layer representing safety"
+
     def add_internal_widgets(self) -> None:
         """
-        This method is called during the widget initialization and sets up the layout for the UI components.
+        This method is called during the widget initialization.
 
-        This component only provides a label as selecting a raster is the only thing needed.
+        This component only provides the INFO_TEXT label as selecting a raster is
+        the only thing needed. The base class creates it when the option is first
+        selected.
         """
-        try:
-            self.info_label = QLabel("A raster layer representing safety")
-            self.internal_layout.addWidget(self.info_label)
-        except Exception as e:
-            log_message(f"Error in add_internal_widgets: {e}", level=Qgis.Critical)
-            import traceback
-
-            log_message(traceback.format_exc(), level=Qgis.Critical)
+        pass
 
     def get_data(self) -> dict:
         """
@@ -45,7 +40,8 @@ class SafetyRasterConfigurationWidget(BaseConfigurationWidget):
             enabled (bool): Whether to enable or disable the internal widgets.
         """
         try:
-            self.info_label.setEnabled(enabled)
+            if self.info_label is not None:
+                self.info_label.setEnabled(enabled)
         except Exception as e:
             log_message(
                 f"Error in set_internal_widgets_enabled: {e}",
@@ -17,35 +17,27 @@ class SingleBufferConfigurationWidget(BaseConfigurationWidget):
         """
         Adds internal widgets specific to self.set_internal_widgets_visible(self.isChecked()) - in this case there are none.
         """
+        # Travel Increments input
+        self.buffer_distance_layout = QHBoxLayout()
+        self.buffer_distance_label = QLabel("Buffer Distance (m):")
+        self.buffer_distance_input = QSpinBox()
+        self.buffer_distance_input.setRange(0, 100000)
+        self.buffer_distance_layout.addWidget(self.buffer_distance_label)
+        self.buffer_distance_layout.addWidget(self.buffer_distance_input)
+        default_distance = self.attributes.get("default_single_buffer_distance", 0)
+        buffer_distance = self.attributes.get(
+            "single_buffer_point_layer_distance", default_distance
+        )
+        if buffer_distance == 0:
+            buffer_distance = default_distance
         try:
+            self.buffer_distance_input.setValue(int(buffer_distance))
+        except (ValueError, TypeError):
+            self.buffer_distance_input.setValue(int(default_distance))
 
-            # Travel Increments input
-            self.buffer_distance_layout = QHBoxLayout()
-            self.buffer_distance_label = QLabel("Buffer Distance (m):")
-            self.buffer_distance_input = QSpinBox()
-            self.buffer_distance_input.setRange(0, 100000)
-            self.buffer_distance_layout.addWidget(self.buffer_distance_label)
-            self.buffer_distance_layout.addWidget(self.buffer_distance_input)
-            default_distance = self.attributes.get("default_single_buffer_distance", 0)
-            buffer_distance = self.attributes.get(
-                "single_buffer_point_layer_distance", default_distance
-            )
-            if buffer_distance == 0:
-                buffer_distance = default_distance
-            try:
-                self.buffer_distance_input.setValue(int(buffer_distance))
-            except (ValueError, TypeError):
-                self.buffer_distance_input.setValue(int(default_distance))
-
-            # Add all layouts to the main layout
-            self.internal_layout.addLayout(self.buffer_distance_layout)
-            self.buffer_distance_input.valueChanged.connect(self.update_data)
-
-        except Exception as e:
-            log_message(f"Error in add_internal_widgets: {e}", level=Qgis.Critical)
-            import traceback
-
-            log_message(traceback.format_exc(), level=Qgis.Critical)
+        # Add all layouts to the main layout
+        self.internal_layout.addLayout(self.buffer_distance_layout)
+        self.buffer_distance_input.valueChanged.connect(self.update_data)
 
     def get_data(self) -> dict:
         """
@@ -13,15 +13,8 @@ class StreetLightsConfigurationWidget(BaseConfigurationWidget):
     """
 
     def add_internal_widgets(self) -> None:
-        try:
-            self.info_label = QLabel("Point locations representing street lights")
-            self.internal_layout.addWidget(self.info_label)
-
-        except Exception as e:
-            log_message(f"Error in add_internal_widgets: {e}", level=Qgis.Critical)
-            import traceback
-
-            log_message(traceback.format_exc(), level=Qgis.Critical)
+        self.info_label = QLabel("Point locations representing street lights")
+        self.internal_layout.addWidget(self.info_label)
 
     def get_data(self) -> dict:
         """
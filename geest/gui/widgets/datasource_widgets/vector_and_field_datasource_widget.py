@@ -5,7 +5,7 @@ from qgis.PyQt.QtWidgets import (
     QFileDialog,
 )
 from qgis.PyQt.QtGui import QIcon
-from qgis.PyQt.QtCore import QSettings, Qt
+from qgis.PyQt.QtCore import QSettings, Qt, QTimer
 
 from qgis.gui import QgsMapLayerComboBox, QgsFieldComboBox
 from qgis.core import (
@@ -28,6 +28,9 @@ class VectorAndFieldDataSourceWidget(BaseDataSourceWidget):
     Subclass this widget to specify the geometry type to filter the QgsMapLayerComboBox.
     """
 
+    # Delay before a typed shapefile path is loaded to refresh the field list
+    SHAPEFILE_EDIT_DELAY_MS = 200
+
     def add_internal_widgets(self) -> None:
         """
         Adds internal widgets specific to vector layer selection
@@ -128,7 +131,14 @@ class VectorAndFieldDataSourceWidget(BaseDataSourceWidget):
             self.shapefile_line_edit.textChanged.connect(self.update_attributes)
             # Connect signals to update the fields when user changes selections
             self.layer_combo.layerChanged.connect(self.update_field_combo)
-            self.shapefile_line_edit.textChanged.connect(self.update_field_combo)
+            # Loading the shapefile is slow, so wait until the user stops typing
+            self.shapefile_timer = QTimer(self)
+            self.shapefile_timer.setSingleShot(True)
+            self.shapefile_timer.setInterval(self.SHAPEFILE_EDIT_DELAY_MS)
+            self.shapefile_timer.timeout.connect(self.update_field_combo)
+            self.shapefile_line_edit.textChanged.connect(
+                lambda text: self.shapefile_timer.start()
+            )
 
             # Connect the field combo box to update the attributes when a field is selected
             self.field_selection_combo.currentIndexChanged.connect(
@@ -312,25 +322,24 @@ class VectorAndFieldDataSourceWidget(BaseDataSourceWidget):
         Returns:
             None
         """
+        key = self.widget_key
+        attributes = self.attributes
         layer = self.layer_combo.currentLayer()
         if not layer:
-            self.attributes[f"{self.widget_key}_layer"] = None
+            attributes[f"{key}_layer"] = None
         else:
-            self.attributes[f"{self.widget_key}_layer_name"] = layer.name()
-            self.attributes[f"{self.widget_key}_layer_source"] = layer.source()
-            self.attributes[f"{self.widget_key}_layer_provider_type"] = (
-                layer.providerType()
+            attributes.update(
+                {
+                    f"{key}_layer_name": layer.name(),
+                    f"{key}_layer_source": layer.source(),
+                    f"{key}_layer_provider_type": layer.providerType(),
+                    # Coordinate Reference System
+                    f"{key}_layer_crs": layer.crs().authid(),
+                    # Geometry type (e.g., Point, Polygon)
+                    f"{key}_layer_wkb_type": QgsWkbTypes.displayString(layer.wkbType()),
+                    # Unique ID of the layer
+                    f"{key}_layer_id": layer.id(),
+                }
             )
-            self.attributes[f"{self.widget_key}_layer_crs"] = (
-                layer.crs().authid()
-            )  # Coordinate Reference System
-            self.attributes[f"{self.widget_key}_layer_wkb_type"] = (
-                QgsWkbTypes.displayString(layer.wkbType())
-            )  # Geometry type (e.g., Point, Polygon)
-            self.attributes[f"{self.widget_key}_layer_id"] = (
-                layer.id()
-            )  # Unique ID of the layer
-        self.attributes[f"{self.widget_key}_shapefile"] = (
-            self.shapefile_line_edit.text()
-        )
+        attributes[f"{key}_shapefile"] = self.shapefile_line_edit.text()
         self.data_changed.emit(self.attributes)
@@ -11,6 +11,17 @@ from .base_datasource_widget import BaseDataSourceWidget
 from qgis.core import QgsMapLayerProxyModel, QgsProject, Qgis
 from geest.utilities import log_message, resources_path
 
+# Layer filter for each analysis mode, checked in order. Modes not listed
+# here use polygon layers.
+_LAYER_FILTERS = (
+    ("use_single_buffer_point", QgsMapLayerProxyModel.PointLayer),
+    ("use_point_per_cell", QgsMapLayerProxyModel.PointLayer),
+    ("use_multi_buffer_point", QgsMapLayerProxyModel.PointLayer),
+    ("use_street_lights", QgsMapLayerProxyModel.PointLayer),
+    ("use_polyline_per_cell", QgsMapLayerProxyModel.LineLayer),
+)
+_DEFAULT_LAYER_FILTER = QgsMapLayerProxyModel.PolygonLayer
+
 
 class VectorDataSourceWidget(BaseDataSourceWidget):
     """
@@ -27,19 +38,11 @@ class VectorDataSourceWidget(BaseDataSourceWidget):
         try:
             # check the attributes to decide what feature types to
             # filter for.
-            filter = None
-            if self.attributes.get("use_single_buffer_point", 0):
-                filter = QgsMapLayerProxyModel.PointLayer
-            elif self.attributes.get("use_point_per_cell", 0):
-                filter = QgsMapLayerProxyModel.PointLayer
-            elif self.attributes.get("use_multi_buffer_point", 0):
-                filter = QgsMapLayerProxyModel.PointLayer
-            elif self.attributes.get("use_street_lights", 0):
-                filter = QgsMapLayerProxyModel.PointLayer
-            elif self.attributes.get("use_polyline_per_cell", 0):
-                filter = QgsMapLayerProxyModel.LineLayer
-            else:
-                filter = QgsMapLayerProxyModel.PolygonLayer
+            filter = _DEFAULT_LAYER_FILTER
+            for key, layer_filter in _LAYER_FILTERS:
+                if self.attributes.get(key, 0):
+                    filter = layer_filter
+                    break
             self.layer_combo = QgsMapLayerComboBox()
             self.layer_combo.setAllowEmptyLayer(True)
             # Insert placeholder text at the top (only visually, not as a selectable item)
@@ -184,24 +187,23 @@ class VectorDataSourceWidget(BaseDataSourceWidget):
         Returns:
             None
         """
+        key = self.widget_key
+        attributes = self.attributes
         layer = self.layer_combo.currentLayer()
         if not layer:
-            self.attributes[f"{self.widget_key}_layer"] = None
+            attributes[f"{key}_layer"] = None
         else:
-            self.attributes[f"{self.widget_key}_layer_name"] = layer.name()
-            self.attributes[f"{self.widget_key}_layer_source"] = layer.source()
-            self.attributes[f"{self.widget_key}_layer_provider_type"] = (
-                layer.providerType()
+            attributes.update(
+                {
+                    f"{key}_layer_name": layer.name(),
+                    f"{key}_layer_source": layer.source(),
+                    f"{key}_layer_provider_type": layer.providerType(),
+                    # Coordinate Reference System
+                    f"{key}_layer_crs": layer.crs().authid(),
+                    # Geometry type (e.g., Point, Polygon)
+                    f"{key}_layer_wkb_type": layer.wkbType(),
+                    # Unique ID of the layer
+                    f"{key}_layer_id": layer.id(),
+                }
             )
-            self.attributes[f"{self.widget_key}_layer_crs"] = (
-                layer.crs().authid()
-            )  # Coordinate Reference System
-            self.attributes[f"{self.widget_key}_layer_wkb_type"] = (
-                layer.wkbType()
-            )  # Geometry type (e.g., Point, Polygon)
-            self.attributes[f"{self.widget_key}_layer_id"] = (
-                layer.id()
-            )  # Unique ID of the layer
-        self.attributes[f"{self.widget_key}_shapefile"] = (
-            self.shapefile_line_edit.text()
-        )
+        attributes[f"{key}_shapefile"] = self.shapefile_line_edit.text()
@@ -10,29 +10,30 @@ from utilities_for_testing import prepare_fixtures
 
 
 class TestSpatialProcessing(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up mock data for the tests.
+        Set up mock data shared by the tests.
+
+        The input layers are only read by the tests so they are built once.
         """
         # Define working directories
-        self.test_data_directory = prepare_fixtures()
-        self.output_directory = os.path.join(self.test_data_directory, "output")
+        cls.test_data_directory = prepare_fixtures()
+        cls.output_directory = os.path.join(cls.test_data_directory, "output")
 
         # Create the output directory if it doesn't exist
-        if not os.path.exists(self.output_directory):
-            os.makedirs(self.output_directory)
+        if not os.path.exists(cls.output_directory):
+            os.makedirs(cls.output_directory)
 
-        self.output_path = os.path.join(self.output_directory, "test_grid.gpkg")
+        cls.output_path = os.path.join(cls.output_directory, "test_grid.gpkg")
 
         # Create an in-memory grid layer
-        self.grid_layer = QgsVectorLayer(
-            "Polygon?crs=EPSG:4326", "Grid Layer", "memory"
-        )
-        grid_provider = self.grid_layer.dataProvider()
+        cls.grid_layer = QgsVectorLayer("Polygon?crs=EPSG:4326", "Grid Layer", "memory")
+        grid_provider = cls.grid_layer.dataProvider()
         grid_fields = QgsFields()
         grid_fields.append(QgsField("id", QVariant.Int))
         grid_provider.addAttributes(grid_fields)
-        self.grid_layer.updateFields()
+        cls.grid_layer.updateFields()
 
         # Add grid cells (2x2 grid with simple square polygons)
         grid_features = [
@@ -53,12 +54,12 @@ class TestSpatialProcessing(unittest.TestCase):
         grid_provider.addFeatures(grid_features)
 
         # Create an in-memory features layer
-        self.features_layer = QgsVectorLayer(
+        cls.features_layer = QgsVectorLayer(
             "Point?crs=EPSG:4326", "Features Layer", "memory"
         )
-        features_provider = self.features_layer.dataProvider()
+        features_provider = cls.features_layer.dataProvider()
         features_provider.addAttributes([QgsField("name", QVariant.String)])
-        self.features_layer.updateFields()
+        cls.features_layer.updateFields()
 
         # Add points that intersect the grid cells
         feature_points = [
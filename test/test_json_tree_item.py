@@ -70,6 +70,21 @@ class TestJsonTreeItem(unittest.TestCase):
         parent.appendChild(sibling)
         self.assertFalse(child.is_only_child())
 
+    def test_row_after_removal(self):
+        """Test row stays correct after children are removed."""
+        parent = JsonTreeItem(self.test_data, role="factor")
+        children = [
+            JsonTreeItem(self.test_data, role="indicator", parent=parent)
+            for _ in range(4)
+        ]
+        for child in children:
+            parent.appendChild(child)
+        self.assertEqual([child.row() for child in children], [0, 1, 2, 3])
+
+        parent.removeChildren(1)
+        self.assertEqual(parent.childItems, [children[0], children[2], children[3]])
+        self.assertEqual([child.row() for child in parent.childItems], [0, 1, 2])
+
     def test_internal_pointer(self):
         """Test internalPointer method."""
         item = JsonTreeItem(self.test_data, role="indicator")
@@ -178,6 +193,15 @@ class TestJsonTreeItem(unittest.TestCase):
         child.updateFactorWeighting(child.guid, 2.5)
         self.assertEqual(float(child.attribute("dimension_weighting")), 2.5)
 
+    def test_weighting_storage(self):
+        """Test weightings are stored as numbers at full precision."""
+        item = JsonTreeItem(["Factor", "", "0.5", {}], role="factor")
+        self.assertEqual(item.data(2), 0.5)
+        item.setData(2, 1 / 3)
+        self.assertEqual(item.data(2), 1 / 3)
+        header = JsonTreeItem(["GEEST2", "Status", "Weight"], role="root")
+        self.assertEqual(header.data(2), "Weight")
+
     def test_status(self):
         """Test getStatus method."""
         # Setup item with default attributes
@@ -239,6 +263,26 @@ class TestJsonTreeItem(unittest.TestCase):
 
         self.assertEqual(indicator.getPaths(), ["fcv", "fcv", "fcv"])
 
+    def test_paths_follow_id_changes(self):
+        """Test getPaths follows changes to the item and ancestor ids."""
+        dimension = JsonTreeItem(self.test_data, role="dimension")
+        self.assertEqual(dimension.getPaths(), ["fcv"])
+
+        dimension.setAttributes(dict(self.test_data[3], id="New Id"))
+        self.assertEqual(dimension.getPaths(), ["new_id"])
+
+        dimension.setAttribute("id", "Other")
+        self.assertEqual(dimension.getPaths(), ["other"])
+
+        # Changes to an ancestor are reflected in the paths below it
+        factor = JsonTreeItem(
+            ["Factor", "", 1.0, {"id": "Factor"}], role="factor", parent=dimension
+        )
+        dimension.appendChild(factor)
+        self.assertEqual(factor.getPaths(), ["other", "factor"])
+        dimension.setAttribute("id", "Renamed")
+        self.assertEqual(factor.getPaths(), ["renamed", "factor"])
+
     def test_get_descendant_indicators(self):
         """Test getDescendantIndicators method."""
         dimension = JsonTreeItem(self.test_data, role="dimension")
@@ -291,6 +335,22 @@ class TestJsonTreeItem(unittest.TestCase):
         self.assertEqual(len(descendants), 1)
         self.assertIs(descendants[0], factor)
 
+    def test_get_descendants_by_role(self):
+        """Test getDescendantsByRole groups items by role in one walk."""
+        dimension = JsonTreeItem(self.test_data, role="dimension")
+        factor = JsonTreeItem(self.test_data, role="factor", parent=dimension)
+        indicator = JsonTreeItem(self.test_data, role="indicator", parent=factor)
+
+        dimension.appendChild(factor)
+        factor.appendChild(indicator)
+
+        descendants = dimension.getDescendantsByRole(
+            ("indicator", "factor", "dimension"), include_disabled=True
+        )
+        self.assertEqual(descendants["dimension"], [dimension])
+        self.assertEqual(descendants["factor"], [factor])
+        self.assertEqual(descendants["indicator"], [indicator])
+
     def test_get_item_by_guid(self):
         """Test getItemByGuid method."""
         parent = JsonTreeItem(self.test_data, role="dimension")
@@ -0,0 +1,59 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsFeature,
+    QgsGeometry,
+    QgsProcessingContext,
+    QgsProject,
+    QgsVectorLayer,
+)
+from geest.core.workflows import MultiBufferDistancesWorkflow
+
+
+class TestMultiBufferStraightLineBuffers(unittest.TestCase):
+    """Tests for the straight line (euclidean) multi buffer path."""
+
+    def setUp(self):
+        """Build a workflow with only the state the buffer path needs."""
+        # Bypass __init__ which needs a full study area and an ORS key
+        self.workflow = MultiBufferDistancesWorkflow.__new__(
+            MultiBufferDistancesWorkflow
+        )
+        self.workflow.distances = [100.0, 200.0]
+        self.workflow.target_crs = QgsCoordinateReferenceSystem("EPSG:32620")
+        self.workflow.context = QgsProcessingContext()
+        self.workflow.context.setProject(QgsProject.instance())
+        self.workflow.euclidean_buffers = True
+        self.workflow.temp_layers = []
+
+        self.point_layer = QgsVectorLayer("Point?crs=EPSG:32620", "points", "memory")
+        feature = QgsFeature()
+        feature.setGeometry(QgsGeometry.fromWkt("POINT(500000 1500000)"))
+        self.point_layer.dataProvider().addFeatures([feature])
+
+    def test_create_distance_buffers(self):
+        """Test a buffer is created for each distance with the distance as value."""
+        layer = self.workflow._create_distance_buffers(
+            list(self.point_layer.getFeatures()), self.point_layer
+        )
+        buffers = {f["value"]: f.geometry() for f in layer.getFeatures()}
+        self.assertEqual(sorted(buffers.keys()), [100, 200])
+        # A 100 m buffer should cover roughly pi * 100^2 square meters
+        self.assertAlmostEqual(buffers[100].area(), 31415.9, delta=100)
+
+    def test_create_multibuffers_skips_ors(self):
+        """Test the straight line path is used without any ORS requests."""
+        self.workflow._fetch_isochrones = MagicMock()
+        with patch.object(
+            MultiBufferDistancesWorkflow, "_merge_and_band", return_value="bands"
+        ) as merge_and_band:
+            result = self.workflow.create_multibuffers(self.point_layer, index=0)
+        self.assertEqual(result, "bands")
+        merge_and_band.assert_called_once_with(0)
+        self.workflow._fetch_isochrones.assert_not_called()
+        self.assertEqual(len(self.workflow.temp_layers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
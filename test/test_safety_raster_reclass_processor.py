@@ -8,48 +8,51 @@ from utilities_for_testing import prepare_fixtures
 
 @unittest.skip("Skip the test for now")
 class TestRasterReclassificationProcessor(unittest.TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Set up the environment for the test, loading the test data layers.
+        Set up shared resources, loading the test data layers once.
         """
-        self.context = QgsProcessingContext()
+        cls.context = QgsProcessingContext()
         # Manually create a QgsProject instance and set it in the context
-        self.project = QgsProject.instance()
-        self.context.setProject(self.project)
+        cls.project = QgsProject.instance()
+        cls.context.setProject(cls.project)
 
         # Define working directories
-        self.test_data_directory = prepare_fixtures()
-        self.output_directory = os.path.join(self.test_data_directory, "output")
+        cls.test_data_directory = prepare_fixtures()
+        cls.output_directory = os.path.join(cls.test_data_directory, "output")
 
         # Create the output directory if it doesn't exist
-        if not os.path.exists(self.output_directory):
-            os.makedirs(self.output_directory)
+        if not os.path.exists(cls.output_directory):
+            os.makedirs(cls.output_directory)
 
         # Define paths to test layers
-        self.input_raster_path = os.path.join(
-            self.test_data_directory, "rasters", "NTL.tif"
+        cls.input_raster_path = os.path.join(
+            cls.test_data_directory, "rasters", "NTL.tif"
         )
-        self.gpkg_path = os.path.join(
-            self.test_data_directory, "study_area", "study_area.gpkg"
+        cls.gpkg_path = os.path.join(
+            cls.test_data_directory, "study_area", "study_area.gpkg"
         )
 
         # Load the input raster and grid layer
-        self.input_raster = QgsRasterLayer(self.input_raster_path, "Input Raster")
-        self.grid_layer = QgsVectorLayer(
-            f"{self.gpkg_path}|layername=study_area_grid", "Grid Layer", "ogr"
+        cls.input_raster = QgsRasterLayer(cls.input_raster_path, "Input Raster")
+        cls.grid_layer = QgsVectorLayer(
+            f"{cls.gpkg_path}|layername=study_area_grid", "Grid Layer", "ogr"
         )
 
-        # Ensure the input layers are valid
-        self.assertTrue(self.input_raster.isValid(), "Failed to load input raster.")
-        self.assertTrue(self.grid_layer.isValid(), "Failed to load grid layer.")
-
         # Set the output VRT path
-        self.output_vrt = os.path.join(
-            self.output_directory, "safety_reclass_output.vrt"
-        )
+        cls.output_vrt = os.path.join(cls.output_directory, "safety_reclass_output.vrt")
 
         # Set the pixel size (example: 100 meters)
-        self.pixel_size = 100.0
+        cls.pixel_size = 100.0
+
+    def setUp(self):
+        """
+        Create a fresh processor for each test.
+        """
+        # Ensure the input layers are valid
+        self.assertTrue(self.input_raster.isValid(), "Failed to load input raster.")
+        self.assertTrue(self.grid_layer.isValid(), "Failed to load grid layer.")
 
         # Initialize the processor with test data
         self.processor = SafetyRasterReclassificationProcessor(